@@ -4,6 +4,7 @@ Contains sample support tickets and knowledge base articles used when
 data_source is set to "bundled" (the default).
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List
 
 TICKETS: List[Dict[str, Any]] = [
@@ -198,13 +199,21 @@ ARTICLES: List[Dict[str, Any]] = [
 ]
 
 
+@lru_cache(maxsize=1)
 def build_article_index() -> Dict[str, Dict[str, Any]]:
-    """Return a dict of articles keyed by article ID."""
+    """Return a dict of articles keyed by article ID.
+
+    Built once and shared by every agent instance; treat it as read-only.
+    """
     return {article["id"]: article for article in ARTICLES}
 
 
+@lru_cache(maxsize=1)
 def build_ticket_index() -> Dict[str, Dict[str, Any]]:
-    """Return a dict of tickets keyed by both ticket ID and slug."""
+    """Return a dict of tickets keyed by both ticket ID and slug.
+
+    Built once and shared by every agent instance; treat it as read-only.
+    """
     index: Dict[str, Dict[str, Any]] = {}
     for ticket in TICKETS:
         index[ticket["id"]] = ticket
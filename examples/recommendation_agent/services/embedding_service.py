@@ -105,3 +105,21 @@ class EmbeddingService(Loggable):
             model=self.model, input=query
         )
         return response.data[0].embedding
+
+    async def get_embedding_queries(self, queries: List[str]) -> List[List[float]]:
+        """Generate embedding vectors for several queries in one provider call.
+
+        Duplicate queries are embedded once. Results are returned in the same
+        order as queries.
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        if not unique_queries:
+            return []
+        self.logger.info(f"Generating embeddings for {len(unique_queries)} queries")
+        response = await self.embedding_provider.embeddings.create(
+            model=self.model, input=unique_queries
+        )
+        embeddings = {
+            unique_queries[item.index]: item.embedding for item in response.data
+        }
+        return [embeddings[query] for query in queries]
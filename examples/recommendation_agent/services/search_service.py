@@ -155,10 +155,14 @@ class SearchService(Loggable):
         score_threshold: float,
         excluded_ids_list: List[str],
     ) -> List[dict]:
-        """Execute searches for all terms and collect deduplicated results."""
+        """Execute searches for all terms and collect deduplicated results.
+
+        Dense embeddings for every search are requested in a single batched
+        provider call before the searches fan out.
+        """
         all_documents = []
         seen_hashes = set()
-        search_tasks = []
+        search_pairs = []
 
         for term in search_terms:
             query_text, keywords_text = self._extract_term_texts(term)
@@ -167,28 +171,27 @@ class SearchService(Loggable):
             ):
                 continue
 
-            search_tasks.append(
-                self._search_qdrant(
-                    keywords_text,
-                    query_text,
-                    collection,
-                    score_threshold,
-                    excluded_ids_list,
-                )
-            )
-            search_tasks.append(
-                self._search_qdrant(
-                    query_text,
-                    keywords_text,
-                    collection,
-                    score_threshold,
-                    excluded_ids_list,
-                )
-            )
+            search_pairs.append((keywords_text, query_text))
+            search_pairs.append((query_text, keywords_text))
 
-        if not search_tasks:
+        if not search_pairs:
             return []
 
+        dense_embeddings = await self.embedding_service.get_embedding_queries(
+            [dense_query for dense_query, _ in search_pairs]
+        )
+        search_tasks = [
+            self._search_qdrant(
+                query_embeddings,
+                sparse_query,
+                collection,
+                score_threshold,
+                excluded_ids_list,
+            )
+            for query_embeddings, (_, sparse_query) in zip(
+                dense_embeddings, search_pairs
+            )
+        ]
         results = await asyncio.gather(*search_tasks)
         for result in results:
             self._add_search_results(result, all_documents, seen_hashes)
@@ -209,14 +212,13 @@ class SearchService(Loggable):
 
     async def _search_qdrant(
         self,
-        query: str,
+        query_embeddings: List[float],
         sparse_query: str,
         collection: Optional[str],
         score_threshold: float,
         excluded_ids_list: List[str],
     ) -> List[dict]:
         """Execute iterative search with dense and sparse embeddings."""
-        query_embeddings = await self.embedding_service.get_embedding_query(query)
         sparse_embeddings = (
             await self.sparse_embedding_service.get_sparse_embedding_query(sparse_query)
         )
@@ -8,10 +8,23 @@ from pathlib import Path
 CONSOLE_SEPARATOR_WIDTH = 60
 
 sdk_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(sdk_path))
-
 template_path = Path(__file__).parent / "template_plugin"
-sys.path.insert(0, str(template_path))
+sys.path[0:0] = [str(sdk_path), str(template_path)]
+
+from cadence_sdk import (  # noqa: E402
+    PluginRegistry,
+    ToolCall,
+    UvAIMessage,
+    UvHumanMessage,
+    UvSystemMessage,
+    UvToolMessage,
+    register_plugin,
+    validate_plugin_structure,
+    validate_plugin_structure_shallow,
+)
+from cadence_sdk.decorators.settings_decorators import (  # noqa: E402
+    get_plugin_settings_schema as sdk_get_schema,
+)
 
 
 def test_imports():
@@ -79,20 +92,18 @@ def test_tool_execution():
         agent.initialize(config)
         print("✓ Agent initialized with config")
 
-        tools = agent.get_tools()
-
-        greet_tool = next(t for t in tools if t.name == "greet")
+        greet_tool = agent.get_tool("greet")
         result = greet_tool(name="World")
         assert "Hi, World!" in result
         print(f"✓ Sync tool execution: {result}")
 
-        search_tool = next(t for t in tools if t.name == "search")
+        search_tool = agent.get_tool("search")
         result = search_tool(query="Python")
         assert "Python" in result
         print(f"✓ Sync tool execution: {result}")
 
         async def test_async():
-            async_tool = next(t for t in tools if t.name == "async_fetch")
+            async_tool = agent.get_tool("async_fetch")
             result = await async_tool.ainvoke(url="https://example.com")
             assert "example.com" in result
             print(f"✓ Async tool execution: {result}")
@@ -113,7 +124,6 @@ def test_registration():
     print("\nTesting plugin registration...")
 
     try:
-        from cadence_sdk import PluginRegistry, register_plugin
         from plugin import TemplatePlugin
 
         PluginRegistry.instance().clear_all()
@@ -152,9 +162,6 @@ def test_plugin_settings_format():
     print("\nTesting plugin_settings format...")
 
     try:
-        from cadence_sdk.decorators.settings_decorators import (
-            get_plugin_settings_schema as sdk_get_schema,
-        )
         from plugin import TemplatePlugin
 
         pid = "io.cadence.examples.template_plugin"
@@ -224,10 +231,6 @@ def test_validation():
     print("\nTesting plugin validation...")
 
     try:
-        from cadence_sdk import (
-            validate_plugin_structure,
-            validate_plugin_structure_shallow,
-        )
         from plugin import TemplatePlugin
 
         is_valid, errors = validate_plugin_structure_shallow(TemplatePlugin)
@@ -252,14 +255,6 @@ def test_messages():
     print("\nTesting message types...")
 
     try:
-        from cadence_sdk import (
-            ToolCall,
-            UvAIMessage,
-            UvHumanMessage,
-            UvSystemMessage,
-            UvToolMessage,
-        )
-
         human_msg = UvHumanMessage(content="Hello")
         assert human_msg.role == "human"
         assert human_msg.content == "Hello"
@@ -1,5 +1,7 @@
 __version__ = "2.0.10"
 
+import importlib
+
 from cadence_sdk.base.exceptions import CadenceException
 from .base import (
     BaseAgent,
@@ -9,8 +11,7 @@ from .base import (
     Loggable,
     PluginMetadata,
 )
-from .decorators import plugin_settings
-from .registry import PluginContract, PluginRegistry, register_plugin
+from .registry import PluginContract, PluginRegistry, register_plugin, register_plugins
 from .types import (
     StreamFilter,
     ToolCall,
@@ -24,12 +25,38 @@ from .types import (
     UvToolMessage,
     uvtool,
 )
-from .utils import (
-    check_dependency_installed,
-    install_dependencies,
-    validate_plugin_structure,
-    validate_plugin_structure_shallow,
-)
+
+_LAZY_ATTRIBUTES = {
+    "validate_plugin_structure_shallow": "utils",
+    "validate_plugin_structure": "utils",
+    "validate_plugin_structures": "utils",
+    "install_dependencies": "utils",
+    "check_dependency_installed": "utils",
+    "plugin_settings": "decorators",
+}
+
+
+def warmup() -> PluginRegistry:
+    """Prepare the SDK for serving before the first request arrives.
+
+    Imports the submodules that are otherwise loaded on first use, so the
+    first plugin lookup does not pay that cost. Hosts should call this from
+    their startup hook, e.g. a FastAPI lifespan handler:
+
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            cadence_sdk.warmup()
+            yield
+
+        app = FastAPI(lifespan=lifespan)
+
+    Returns:
+        The global PluginRegistry instance
+    """
+    for module_name in ("decorators", "types", "utils.validation"):
+        importlib.import_module(f"{__name__}.{module_name}")
+    return PluginRegistry.instance()
+
 
 __all__ = [
     "__version__",
@@ -54,9 +81,25 @@ __all__ = [
     "PluginContract",
     "PluginRegistry",
     "register_plugin",
+    "register_plugins",
     "validate_plugin_structure_shallow",
     "validate_plugin_structure",
+    "validate_plugin_structures",
     "install_dependencies",
     "check_dependency_installed",
     "plugin_settings",
+    "warmup",
 ]
+
+
+def __getattr__(name: str):
+    submodule = _LAZY_ATTRIBUTES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
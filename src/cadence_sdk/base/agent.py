@@ -4,8 +4,11 @@ This module defines the BaseAgent abstract class that all plugin agents
 must implement.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+DEFAULT_TOOL_CONCURRENCY = 16
 
 
 class BaseAgent(ABC):
@@ -27,6 +30,8 @@ class BaseAgent(ABC):
         - cleanup(): Called when agent is being destroyed
     """
 
+    _tool_index: Optional[Dict[str, "UvTool"]] = None  # type: ignore[name-defined]  # noqa: F821
+
     @abstractmethod
     def get_tools(self) -> List["UvTool"]:  # type: ignore[name-defined]  # noqa: F821
         """Get list of tools provided by this agent.
@@ -43,13 +48,72 @@ class BaseAgent(ABC):
         """
         ...
 
+    def get_tool(self, name: str) -> "UvTool":  # type: ignore[name-defined]  # noqa: F821
+        """Get a tool by name.
+
+        The name index is built from get_tools() on first call and reused
+        afterwards, so lookups are a single dict access.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            The UvTool registered under name
+
+        Raises:
+            KeyError: If the agent has no tool with that name
+        """
+        if self._tool_index is None:
+            self._tool_index = {tool.name: tool for tool in self.get_tools()}
+        try:
+            return self._tool_index[name]
+        except KeyError:
+            raise KeyError(
+                f"Agent {self.__class__.__name__} has no tool named '{name}'"
+            ) from None
+
+    async def ainvoke_tools(
+        self,
+        calls: List["ToolCall"],  # type: ignore[name-defined]  # noqa: F821
+        concurrency: int = DEFAULT_TOOL_CONCURRENCY,
+    ) -> List[Any]:
+        """Invoke several tool calls concurrently.
+
+        At most `concurrency` calls run at once; the rest wait on a semaphore.
+        The first exception raised by a tool propagates to the caller. The
+        other calls are not cancelled and keep running in the background,
+        and their results or errors are discarded.
+
+        Args:
+            calls: Tool calls to run, resolved by name via get_tool()
+            concurrency: Maximum number of calls in flight
+
+        Returns:
+            Tool results in the same order as calls
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _invoke(call) -> Any:
+            async with semaphore:
+                return await self.get_tool(call.name).ainvoke(**call.args)
+
+        return list(await asyncio.gather(*(_invoke(call) for call in calls)))
+
     def initialize(self, config: Dict[str, Any]) -> None:
         """Optional — override to set up state when the agent is first created.
 
+        The base implementation discards the get_tool() index; overrides that
+        rebuild tools should call super().initialize(config).
+
         Args:
             config: Configuration dictionary (from settings resolver)
         """
-        pass
+        self._tool_index = None
 
     async def cleanup(self) -> None:
         """Clean up agent resources.
@@ -17,19 +17,19 @@ class Loggable:
                 self.logger.debug("Debug details")
     """
 
-    _logger: Optional[logging.Logger] = None
-
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class.
 
         Creates a logger on first access, named after the class's module and name.
+        The logger is cached on the class, so every instance shares it.
         """
-        if self._logger is None:
-            self._logger = logging.getLogger(
-                f"{self.__class__.__module__}.{self.__class__.__name__}"
-            )
-        return self._logger
+        cls = type(self)
+        logger: Optional[logging.Logger] = cls.__dict__.get("_class_logger")
+        if logger is None:
+            logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+            cls._class_logger = logger
+        return logger
 
     def set_log_level(self, level: int) -> None:
         """Set the logging level for this instance.
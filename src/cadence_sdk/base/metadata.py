@@ -7,16 +7,41 @@ IMPORTANT: v3.0 architectural change - LLM configuration is NO LONGER
 part of plugin metadata. The framework owns all LLM configuration.
 """
 
-from dataclasses import dataclass, field
-from typing import List
-
-MIN_VERSION_PARTS = 2
-MAX_VERSION_PARTS = 3
+import functools
+import json
+import re
+import sys
+from dataclasses import dataclass
+from typing import Tuple
+
+_SEMVER_RE = re.compile(r"\d+\.\d+(?:\.\d+)?(?:[-+][0-9A-Za-z.-]+)?")
 DEFAULT_SDK_VERSION_REQUIREMENT = ">=2.0.0,<3.0.0"
 
 
-@dataclass
-class PluginMetadata:
+@functools.lru_cache(maxsize=512)
+def _check_version_format(version: str) -> bool:
+    """Raise ValueError for a malformed version; only valid versions are cached."""
+    if not _SEMVER_RE.fullmatch(version):
+        raise ValueError(
+            f"Invalid version format: {version}. "
+            "Expected format: MAJOR.MINOR or MAJOR.MINOR.PATCH, "
+            "optionally followed by -prerelease or +build"
+        )
+    return True
+
+
+class _MetadataCacheSlots:
+    """Slots for per-instance caches, kept out of the dataclass fields.
+
+    Being plain slots rather than fields, they are invisible to
+    dataclasses.asdict(), replace(), ==, repr() and pickling.
+    """
+
+    __slots__ = ("_dict_cache", "_json_cache")
+
+
+@dataclass(frozen=True, slots=True)
+class PluginMetadata(_MetadataCacheSlots):
     """Metadata describing a Cadence plugin.
 
     This metadata is used for plugin discovery, validation, and registration.
@@ -34,8 +59,10 @@ class PluginMetadata:
         description: Human-readable description of plugin capabilities.
             Can be overridden per orchestrator instance in Tier 4
             node_settings.
-        capabilities: List of capability tags (e.g., ["search", "web_browsing"])
-        dependencies: List of pip package dependencies (e.g., ["requests>=2.28"])
+        capabilities: Capability tags (e.g., ["search", "web_browsing"]).
+            Any iterable is accepted and stored as a tuple.
+        dependencies: Pip package dependencies (e.g., ["requests>=2.28"]).
+            Any iterable is accepted and stored as a tuple.
         sdk_version: Compatible SDK version range (default ">=2.0.0,<4.0.0")
         stateless: Whether this plugin is stateless (default True)
 
@@ -57,20 +84,26 @@ class PluginMetadata:
         - Plugins declare tools and logic, not models
         - pid uses reverse-domain convention (e.g., com.example.my_plugin)
           to guarantee global uniqueness across all tenants and system plugins
+        - Instances are frozen; use dataclasses.replace() to derive a copy
     """
 
     pid: str
     name: str
     version: str
     description: str
-    capabilities: List[str] = field(default_factory=list)
-    dependencies: List[str] = field(default_factory=list)
+    capabilities: Tuple[str, ...] = ()
+    dependencies: Tuple[str, ...] = ()
     sdk_version: str = DEFAULT_SDK_VERSION_REQUIREMENT
     stateless: bool = True
 
     def __post_init__(self):
         self._validate_required_fields()
         self._validate_version_format()
+        # pids are compared and hashed on every registry lookup; interning
+        # lets equal pids from different sources share one string object.
+        object.__setattr__(self, "pid", sys.intern(self.pid))
+        object.__setattr__(self, "capabilities", tuple(self.capabilities))
+        object.__setattr__(self, "dependencies", tuple(self.dependencies))
 
     def _validate_required_fields(self) -> None:
         if not self.pid:
@@ -83,26 +116,44 @@ class PluginMetadata:
             raise ValueError("Plugin description cannot be empty")
 
     def _validate_version_format(self) -> None:
-        version_parts = self.version.split(".")
-        is_valid_format = MIN_VERSION_PARTS <= len(version_parts) <= MAX_VERSION_PARTS
-
-        if not is_valid_format:
-            raise ValueError(
-                f"Invalid version format: {self.version}. "
-                "Expected format: MAJOR.MINOR or MAJOR.MINOR.PATCH"
-            )
+        _check_version_format(self.version)
 
     def to_dict(self) -> dict:
-        return {
-            "pid": self.pid,
-            "name": self.name,
-            "version": self.version,
-            "description": self.description,
-            "capabilities": self.capabilities,
-            "dependencies": self.dependencies,
-            "sdk_version": self.sdk_version,
-            "stateless": self.stateless,
-        }
+        """Return a dict of the metadata fields.
+
+        The dict is built once per instance; each call returns a shallow copy
+        with capabilities and dependencies as fresh lists.
+        """
+        try:
+            cached = self._dict_cache
+        except AttributeError:
+            cached = {
+                "pid": self.pid,
+                "name": self.name,
+                "version": self.version,
+                "description": self.description,
+                "capabilities": self.capabilities,
+                "dependencies": self.dependencies,
+                "sdk_version": self.sdk_version,
+                "stateless": self.stateless,
+            }
+            object.__setattr__(self, "_dict_cache", cached)
+        data = cached.copy()
+        data["capabilities"] = list(self.capabilities)
+        data["dependencies"] = list(self.dependencies)
+        return data
+
+    def to_json(self) -> str:
+        """Return the to_dict() fields as a JSON string.
+
+        The string is encoded once per instance and reused afterwards.
+        """
+        try:
+            cached = self._json_cache
+        except AttributeError:
+            cached = json.dumps(self.to_dict(), separators=(",", ":"))
+            object.__setattr__(self, "_json_cache", cached)
+        return cached
 
     @classmethod
     def from_dict(cls, data: dict) -> "PluginMetadata":
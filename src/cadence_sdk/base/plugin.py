@@ -1,18 +1,17 @@
 """Base plugin interface for Cadence SDK.
 
-This module defines the BasePlugin abstract class that all plugins
+This module defines the BasePlugin base class that all plugins
 must implement.
 """
 
-from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
 from .agent import BaseAgent
 from .metadata import PluginMetadata
 
 
-class BasePlugin(ABC):
-    """Abstract base class for Cadence plugins.
+class BasePlugin:
+    """Base class for Cadence plugins.
 
     All plugins must inherit from this class and implement the required
     static methods. A plugin is a factory for creating agent instances.
@@ -24,6 +23,10 @@ class BasePlugin(ABC):
         - get_metadata(): Return PluginMetadata describing the plugin
         - create_agent(): Return a BaseAgent instance
 
+    BasePlugin is a plain class rather than an ABC, so subclass checks skip
+    ABCMeta. PluginContract rejects plugins that leave a required method
+    unimplemented.
+
     Optional Methods:
         - get_settings_schema(): Return settings schema (alternative to @plugin_settings)
         - validate_dependencies(): Check if dependencies are available
@@ -55,16 +58,14 @@ class BasePlugin(ABC):
     """
 
     @staticmethod
-    @abstractmethod
     def get_metadata() -> PluginMetadata:
         """Return PluginMetadata describing the plugin's name, version, capabilities, and requirements."""
-        ...
+        raise NotImplementedError("Plugin must implement get_metadata()")
 
     @staticmethod
-    @abstractmethod
     def create_agent() -> BaseAgent:
         """Return a new BaseAgent instance. Each call should return a fresh instance."""
-        ...
+        raise NotImplementedError("Plugin must implement create_agent()")
 
     @staticmethod
     def validate_dependencies() -> List[str]:
@@ -81,9 +82,22 @@ class BasePlugin(ABC):
         """Return a dictionary with health status information."""
         return {"status": "unknown"}
 
+    @classmethod
+    def _cached_metadata(cls) -> PluginMetadata:
+        """Return get_metadata(), computed once per plugin class.
+
+        Stored in the class's own __dict__ so subclasses never see a parent's
+        metadata. Sharing is safe because PluginMetadata is frozen.
+        """
+        metadata = cls.__dict__.get("_metadata_cache")
+        if metadata is None:
+            metadata = cls.get_metadata()
+            cls._metadata_cache = metadata
+        return metadata
+
     def __repr__(self) -> str:
         try:
-            metadata = self.get_metadata()
+            metadata = self._cached_metadata()
             return f"{self.__class__.__name__}(name='{metadata.name}', version='{metadata.version}')"
         except Exception:
             return f"{self.__class__.__name__}()"
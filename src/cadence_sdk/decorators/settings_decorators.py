@@ -8,7 +8,23 @@ from typing import Any, Callable, Dict, List, Literal, Optional
 
 SettingType = Literal["str", "int", "float", "bool", "list", "dict"]
 
-VALID_SETTING_TYPES = {"str", "int", "float", "bool", "list", "dict"}
+VALID_SETTING_TYPES = frozenset({"str", "int", "float", "bool", "list", "dict"})
+
+_REQUIRED_SETTING_FIELDS = ("key", "type", "description")
+_BOOLEAN_SETTING_FLAGS = ("required", "sensitive")
+
+_TYPE_MAP: Dict[str, type] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+}
+
+_SCHEMA_CACHE_ATTR = "_cadence_settings_schema_cache"
+_SETTINGS_VALIDATOR_ATTR = "_cadence_settings_validator"
+_SETTINGS_INDEX_ATTR = "_cadence_settings_index"
 
 
 def plugin_settings(settings_list: List[Dict[str, Any]]) -> Callable:
@@ -69,15 +85,17 @@ def plugin_settings(settings_list: List[Dict[str, Any]]) -> Callable:
     def decorator(cls: type) -> type:
         """Inner decorator that attaches settings schema to class."""
         _validate_settings_schema(settings_list)
-        normalized = [
-            {**setting, "name": setting.get("name", setting["key"])}
-            for setting in settings_list
-        ]
+        normalized = []
+        for setting in settings_list:
+            setting = setting.copy()
+            setting.setdefault("name", setting["key"])
+            normalized.append(setting)
 
         original_get_settings = getattr(cls, "get_settings_schema", None)
         cls.get_settings_schema = _create_settings_schema_method(
             normalized, original_get_settings
         )
+        clear_plugin_settings_cache(cls)
 
         return cls
 
@@ -95,25 +113,37 @@ def _create_settings_schema_method(
 
     Returns:
         staticmethod that returns settings schema
+
+    Note:
+        An existing method is called once here and its result concatenated
+        up front. If that call fails, for example because the method needs
+        config that is not loaded yet, the combination is deferred to each
+        call instead. Each call returns a new list.
     """
+    combined = settings_list
     if original_method and callable(original_method):
+        try:
+            combined = settings_list + original_method()
+        except Exception:
 
-        def combined_get_settings():
-            method_settings = original_method()
-            return settings_list + method_settings
+            def combined_get_settings() -> List[Dict[str, Any]]:
+                return settings_list + original_method()
 
-        return staticmethod(combined_get_settings)
-    else:
+            return staticmethod(combined_get_settings)
 
-        def get_settings_schema() -> List[Dict[str, Any]]:
-            return settings_list
+    def get_settings_schema() -> List[Dict[str, Any]]:
+        return list(combined)
 
-        return staticmethod(get_settings_schema)
+    return staticmethod(get_settings_schema)
 
 
 def _validate_settings_schema(settings_list: List[Dict[str, Any]]) -> None:
     """Validate settings schema format.
 
+    All per-setting checks run in a single pass over the list. Duplicate
+    keys are detected afterwards with one set comparison, and the list is
+    only scanned again to name the duplicate when one exists.
+
     Args:
         settings_list: Settings schema to validate
 
@@ -123,157 +153,131 @@ def _validate_settings_schema(settings_list: List[Dict[str, Any]]) -> None:
     if not isinstance(settings_list, list):
         raise ValueError("settings_list must be a list")
 
-    seen_keys = set()
-
     for index, setting in enumerate(settings_list):
         if not isinstance(setting, dict):
             raise ValueError(f"Setting at index {index} must be a dict")
 
-        _validate_setting_required_fields(setting, index)
+        for field in _REQUIRED_SETTING_FIELDS:
+            if field not in setting:
+                raise ValueError(f"Setting at index {index} missing '{field}' field")
 
         key = setting["key"]
         setting_type = setting["type"]
 
-        _validate_unique_key(key, seen_keys)
-        seen_keys.add(key)
-
-        _validate_setting_type(setting_type, key)
-        _validate_boolean_flags(setting, key)
-        _validate_default_value_type(setting, setting_type, key)
-
-
-def _validate_setting_required_fields(setting: Dict[str, Any], index: int) -> None:
-    """Validate setting has required fields.
-
-    Args:
-        setting: Setting dictionary
-        index: Setting index for error messages
-
-    Raises:
-        ValueError: If required fields are missing
-    """
-    for field in ("key", "type", "description"):
-        if field not in setting:
-            raise ValueError(f"Setting at index {index} missing '{field}' field")
-
-
-def _validate_unique_key(key: str, seen_keys: set) -> None:
-    """Validate setting key is unique.
-
-    Args:
-        key: Setting key
-        seen_keys: Set of already seen keys
-
-    Raises:
-        ValueError: If key is duplicate
-    """
-    if key in seen_keys:
-        raise ValueError(f"Duplicate setting key: {key}")
-
+        expected_type = _TYPE_MAP.get(setting_type)
+        if expected_type is None:
+            raise ValueError(
+                f"Invalid type '{setting_type}' for setting '{key}'. "
+                f"Must be one of: {', '.join(sorted(VALID_SETTING_TYPES))}"
+            )
+
+        for flag in _BOOLEAN_SETTING_FLAGS:
+            if flag in setting and not isinstance(setting[flag], bool):
+                raise ValueError(f"'{flag}' field for setting '{key}' must be bool")
+
+        default_value = setting.get("default")
+        if default_value is not None and not isinstance(default_value, expected_type):
+            raise ValueError(
+                f"Default value for setting '{key}' has type "
+                f"{type(default_value).__name__}, but declared type is '{setting_type}'"
+            )
+
+    keys = [setting["key"] for setting in settings_list]
+    if len(set(keys)) != len(keys):
+        seen_keys = set()
+        for key in keys:
+            if key in seen_keys:
+                raise ValueError(f"Duplicate setting key: {key}")
+            seen_keys.add(key)
 
-def _validate_setting_type(setting_type: str, key: str) -> None:
-    """Validate setting type is valid.
 
-    Args:
-        setting_type: Type string
-        key: Setting key for error message
-
-    Raises:
-        ValueError: If type is invalid
-    """
-    if setting_type not in VALID_SETTING_TYPES:
-        raise ValueError(
-            f"Invalid type '{setting_type}' for setting '{key}'. "
-            f"Must be one of: {VALID_SETTING_TYPES}"
-        )
+def get_plugin_settings_schema(plugin_class: type) -> List[Dict[str, Any]]:
+    """Get settings schema from a plugin class.
 
+    This is a utility function to retrieve the settings schema that was
+    attached by the @plugin_settings decorator or via get_settings_schema() method.
+    When both exist, prefers get_settings_schema() since the decorator replaces
+    it with a combined method (decorator + method additions).
 
-def _validate_boolean_flags(setting: Dict[str, Any], key: str) -> None:
-    """Validate required and sensitive flags are booleans.
+    The resolved schema is cached on the plugin class, so the schema method
+    runs once per class rather than on every settings resolution. A
+    get_settings_schema() whose result changes later is therefore frozen at
+    its first result; call clear_plugin_settings_cache() after such a change.
+    Schemas combined by @plugin_settings are already fixed at decoration.
 
     Args:
-        setting: Setting dictionary
-        key: Setting key for error message
-
-    Raises:
-        ValueError: If flags are not boolean
-    """
-    if "required" in setting and not isinstance(setting["required"], bool):
-        raise ValueError(f"'required' field for setting '{key}' must be bool")
-
-    if "sensitive" in setting and not isinstance(setting["sensitive"], bool):
-        raise ValueError(f"'sensitive' field for setting '{key}' must be bool")
-
-
-def _validate_default_value_type(
-    setting: Dict[str, Any], setting_type: str, key: str
-) -> None:
-    """Validate default value type matches declared type.
+        plugin_class: Plugin class to inspect
 
-    Args:
-        setting: Setting dictionary
-        setting_type: Declared type string
-        key: Setting key for error message
+    Returns:
+        List of setting definitions, or empty list if none defined
 
-    Raises:
-        ValueError: If default value type doesn't match
+    Example:
+        schema = get_plugin_settings_schema(MyPlugin)
+        for setting in schema:
+            print(f"{setting['name']} ({setting['key']}): {setting['description']}")
     """
-    if "default" not in setting:
-        return
+    cached = plugin_class.__dict__.get(_SCHEMA_CACHE_ATTR)
+    if cached is None:
+        cached = tuple(_resolve_settings_schema(plugin_class))
+        setattr(plugin_class, _SCHEMA_CACHE_ATTR, cached)
+    return list(cached)
 
-    default_value = setting["default"]
-    expected_type = _get_python_type(setting_type)
 
-    if default_value is not None and not isinstance(default_value, expected_type):
-        raise ValueError(
-            f"Default value for setting '{key}' has type {type(default_value).__name__}, "
-            f"but declared type is '{setting_type}'"
-        )
+def get_plugin_setting(plugin_class: type, key: str) -> Optional[Dict[str, Any]]:
+    """Get a single setting definition from a plugin class by key.
 
-
-def _get_python_type(type_str: str) -> type:
-    """Map type string to Python type.
+    Looks the key up in a {key: setting} index built from
+    get_plugin_settings_schema() on first use and cached on the plugin class
+    until clear_plugin_settings_cache() is called.
 
     Args:
-        type_str: Type string
+        plugin_class: Plugin class to inspect
+        key: Setting key to look up
 
     Returns:
-        Python type class
-    """
-    type_map = {
-        "str": str,
-        "int": int,
-        "float": float,
-        "bool": bool,
-        "list": list,
-        "dict": dict,
-    }
-    return type_map[type_str]
+        The setting definition, or None if the plugin declares no such key
 
+    Example:
+        api_key = get_plugin_setting(MyPlugin, "api_key")
+        if api_key and api_key.get("sensitive"):
+            ...
+    """
+    index = plugin_class.__dict__.get(_SETTINGS_INDEX_ATTR)
+    if index is None:
+        index = {}
+        for setting in get_plugin_settings_schema(plugin_class):
+            index.setdefault(setting["key"], setting)
+        setattr(plugin_class, _SETTINGS_INDEX_ATTR, index)
+    return index.get(key)
 
-def get_plugin_settings_schema(plugin_class: type) -> List[Dict[str, Any]]:
-    """Get settings schema from a plugin class.
 
-    This is a utility function to retrieve the settings schema that was
-    attached by the @plugin_settings decorator or via get_settings_schema() method.
-    When both exist, prefers get_settings_schema() since the decorator replaces
-    it with a combined method (decorator + method additions).
+def clear_plugin_settings_cache(plugin_class: type) -> None:
+    """Drop the settings schema, index and validator cached on a plugin class.
 
-    Args:
-        plugin_class: Plugin class to inspect
+    The next get_plugin_settings_schema(), get_plugin_setting() or
+    validate_plugin_settings() call calls get_settings_schema() again. The
+    @plugin_settings decorator calls this itself.
 
-    Returns:
-        List of setting definitions, or empty list if none defined
+    For a @plugin_settings class, get_settings_schema() itself returns the
+    schema combined at decoration time, so clearing picks up nothing new
+    unless the inherited method failed then and is resolved per call.
 
-    Example:
-        schema = get_plugin_settings_schema(MyPlugin)
-        for setting in schema:
-            print(f"{setting['name']} ({setting['key']}): {setting['description']}")
+    Args:
+        plugin_class: Plugin class whose cached settings data is dropped
     """
-    if hasattr(plugin_class, "get_settings_schema"):
-        method = getattr(plugin_class, "get_settings_schema")
-        if callable(method):
-            result = method()
-            return result if result is not None else []
+    for cache_attr in (
+        _SCHEMA_CACHE_ATTR,
+        _SETTINGS_VALIDATOR_ATTR,
+        _SETTINGS_INDEX_ATTR,
+    ):
+        if cache_attr in plugin_class.__dict__:
+            delattr(plugin_class, cache_attr)
+
+
+def _resolve_settings_schema(plugin_class: type) -> List[Dict[str, Any]]:
+    method = getattr(plugin_class, "get_settings_schema", None)
+    if callable(method):
+        result = method()
+        return result if result is not None else []
 
     return []
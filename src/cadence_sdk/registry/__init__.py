@@ -1,10 +1,11 @@
 """Plugin registry and discovery system."""
 
 from .contracts import PluginContract
-from .plugin_registry import PluginRegistry, register_plugin
+from .plugin_registry import PluginRegistry, register_plugin, register_plugins
 
 __all__ = [
     "PluginContract",
     "PluginRegistry",
     "register_plugin",
+    "register_plugins",
 ]
@@ -1,6 +1,9 @@
 """Plugin contract wrapper for standardized interface."""
 
-from typing import Optional, Type
+import functools
+import time
+import weakref
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Type
 
 from ..base import (
     BaseAgent,
@@ -10,6 +13,65 @@ from ..base import (
     PluginMetadata,
 )
 
+if TYPE_CHECKING:
+    from packaging.version import Version
+
+HEALTH_CHECK_TTL_SECONDS = 5.0
+_REQUIRED_PLUGIN_METHODS = ("get_metadata", "create_agent")
+
+# Agents built by validate_plugin_structure() for stateless plugins, waiting
+# to be adopted by PluginContract.get_shared_agent(). Adoption removes the
+# entry. An agent usually references its plugin class through its module
+# globals, so entries for classes that are validated but never wrapped in a
+# contract stay until clear_validated_agents() is called.
+_validated_agents: "weakref.WeakKeyDictionary[type, BaseAgent]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def clear_validated_agents() -> None:
+    """Drop agents kept by validate_plugin_structure() that were not adopted."""
+    _validated_agents.clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_version(version: str) -> Optional["Version"]:
+    """Parse a version string, returning None when it is not PEP 440.
+
+    packaging is imported on the first cache miss, so importing the SDK
+    does not load it.
+    """
+    from packaging import version as pkg_version
+
+    try:
+        return pkg_version.parse(version)
+    except pkg_version.InvalidVersion:
+        return None
+
+
+class RegistryIndexes:
+    """Lookup tables kept alongside the registry's pid map.
+
+    Attributes:
+        capability_to_pids: Capability tag to the pids declaring it. Each
+            value is a dict used as an insertion-ordered set so queries keep
+            registration order.
+    """
+
+    __slots__ = ("capability_to_pids",)
+
+    def __init__(self):
+        self.capability_to_pids: Dict[str, Dict[str, None]] = {}
+
+    def copy(self) -> "RegistryIndexes":
+        """Return an independent copy that can be updated without affecting this one."""
+        indexes = RegistryIndexes()
+        indexes.capability_to_pids = {
+            capability: dict(pids)
+            for capability, pids in self.capability_to_pids.items()
+        }
+        return indexes
+
 
 class PluginContract:
     """Wrapper providing standardized interface to plugin classes.
@@ -23,46 +85,71 @@ class PluginContract:
 
     Attributes:
         plugin_class: The plugin class being wrapped
-        metadata: Cached metadata from plugin
+        metadata: Metadata read from the plugin once, at construction
+        pid: Plugin ID from metadata
+        name: Display name from metadata
+        version: Version string from metadata
+        description: Description from metadata
+        capabilities: Capability tags from metadata
+        is_stateless: Stateless flag from metadata
     """
 
+    __slots__ = (
+        "plugin_class",
+        "metadata",
+        "pid",
+        "name",
+        "version",
+        "description",
+        "capabilities",
+        "is_stateless",
+        "_agent_type_cache",
+        "_shared_agent",
+        "_deps_cache",
+        "_health_cache",
+        "_parsed_version",
+    )
+
     def __init__(self, plugin_class: Type[BasePlugin]):
         if not issubclass(plugin_class, BasePlugin):
             raise TypeError(f"{plugin_class.__name__} must inherit from BasePlugin")
+        for method_name in _REQUIRED_PLUGIN_METHODS:
+            method = getattr(plugin_class, method_name, None)
+            if not callable(method) or method is getattr(BasePlugin, method_name):
+                raise TypeError(
+                    f"{plugin_class.__name__} must implement {method_name}()"
+                )
 
         self.plugin_class = plugin_class
-        self._metadata: Optional[PluginMetadata] = None
+        self.metadata: PluginMetadata = plugin_class._cached_metadata()
+        self.pid: str = self.metadata.pid
+        self.name: str = self.metadata.name
+        self.version: str = self.metadata.version
+        self.description: str = self.metadata.description
+        self.capabilities: tuple[str, ...] = self.metadata.capabilities
+        self.is_stateless: bool = self.metadata.stateless
         self._agent_type_cache: Optional[tuple[bool, bool]] = None
-
-    @property
-    def metadata(self) -> PluginMetadata:
-        if self._metadata is None:
-            self._metadata = self.plugin_class.get_metadata()
-        return self._metadata
-
-    @property
-    def pid(self) -> str:
-        return self.metadata.pid
-
-    @property
-    def name(self) -> str:
-        return self.metadata.name
-
-    @property
-    def version(self) -> str:
-        return self.metadata.version
-
-    @property
-    def description(self) -> str:
-        return self.metadata.description
-
-    @property
-    def capabilities(self) -> list[str]:
-        return self.metadata.capabilities
+        self._shared_agent: Optional[BaseAgent] = None
+        self._deps_cache: Optional[list[str]] = None
+        self._health_cache: Optional[tuple[float, dict]] = None
+        self._parsed_version = _parse_version(self.version)
+
+    @classmethod
+    def from_classes(
+        cls, plugin_classes: Iterable[Type[BasePlugin]]
+    ) -> List["PluginContract"]:
+        """Build contracts for several plugin classes in one call.
+
+        Raises:
+            TypeError: If any class is not a valid BasePlugin subclass
+        """
+        return [cls(plugin_class) for plugin_class in plugin_classes]
 
     def _get_agent_type_flags(self) -> tuple[bool, bool]:
         if self._agent_type_cache is None:
-            agent = self.plugin_class.create_agent()
+            # Probe with a throwaway agent rather than get_shared_agent(), so
+            # type queries don't pin an agent for the process lifetime.
+            agent = self._shared_agent or self.create_agent()
             self._agent_type_cache = (
                 isinstance(agent, BaseSpecializedAgent),
                 isinstance(agent, BaseScopedAgent),
@@ -77,18 +164,63 @@ class PluginContract:
     def is_scoped(self) -> bool:
         return self._get_agent_type_flags()[1]
 
-    @property
-    def is_stateless(self) -> bool:
-        return self.metadata.stateless
-
     def create_agent(self) -> BaseAgent:
         return self.plugin_class.create_agent()
 
+    def get_shared_agent(self) -> BaseAgent:
+        """Return a process-wide agent for stateless plugins.
+
+        Stateless plugins build their agent once and every call returns that
+        instance; an agent left by validate_plugin_structure() is taken over
+        instead of creating another. Stateful plugins get a fresh agent per
+        call, same as create_agent(). Use create_agent() when the agent will
+        be initialized with per-instance configuration.
+        """
+        if not self.is_stateless:
+            return self.create_agent()
+        if self._shared_agent is None:
+            agent = _validated_agents.pop(self.plugin_class, None)
+            self._shared_agent = agent if agent is not None else self.create_agent()
+        return self._shared_agent
+
     def validate_dependencies(self) -> list[str]:
-        return self.plugin_class.validate_dependencies()
+        """Return dependency errors, checked once per contract.
+
+        Call invalidate_caches() after installing dependencies to re-check.
+        """
+        if self._deps_cache is None:
+            self._deps_cache = list(self.plugin_class.validate_dependencies())
+        return list(self._deps_cache)
 
     def health_check(self) -> dict:
-        return self.plugin_class.health_check()
+        """Return plugin health, reusing results for HEALTH_CHECK_TTL_SECONDS."""
+        now = time.monotonic()
+        if (
+            self._health_cache is None
+            or now - self._health_cache[0] >= HEALTH_CHECK_TTL_SECONDS
+        ):
+            self._health_cache = (now, self.plugin_class.health_check())
+        return dict(self._health_cache[1])
+
+    def invalidate_caches(self) -> None:
+        """Drop cached dependency and health check results."""
+        self._deps_cache = None
+        self._health_cache = None
+
+    def index_into(self, indexes: RegistryIndexes) -> None:
+        """Add this contract's pid under each of its capabilities."""
+        for capability in self.capabilities:
+            indexes.capability_to_pids.setdefault(capability, {})[self.pid] = None
+
+    def remove_from(self, indexes: RegistryIndexes) -> None:
+        """Remove this contract's pid from each of its capabilities."""
+        for capability in self.capabilities:
+            pids = indexes.capability_to_pids.get(capability)
+            if pids is None:
+                continue
+            pids.pop(self.pid, None)
+            if not pids:
+                del indexes.capability_to_pids[capability]
 
     def __repr__(self) -> str:
         return f"PluginContract(pid='{self.pid}', version='{self.version}')"
@@ -7,13 +7,15 @@ two plugins from any source — system, tenant, or environment — can conflict.
 """
 
 import threading
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
 
-from packaging import version as pkg_version
-
-from .contracts import PluginContract
+from .contracts import PluginContract, RegistryIndexes
 from ..base import BasePlugin
 
+# A pid with one registered version maps straight to its contract; a second
+# version promotes the entry to a version -> contract dict.
+_VersionEntry = Union[PluginContract, Dict[str, PluginContract]]
+
 
 class PluginRegistry:
     """Singleton registry for Cadence plugins.
@@ -34,24 +36,37 @@ class PluginRegistry:
 
     This is a singleton class - use PluginRegistry.instance() to access it.
 
-    Thread-safe for concurrent registrations.
+    Thread-safe for concurrent registrations. Writers build new copies of
+    the plugin dicts under a lock and publish them with a single reference
+    swap; lookups read the current snapshot without locking.
     """
 
-    _instance: Optional["PluginRegistry"] = None
-    _lock = threading.Lock()
+    __slots__ = (
+        "_plugins",
+        "_versions_by_pid",
+        "_indexes",
+        "_list_cache",
+        "_type_cache",
+        "_registry_lock",
+    )
 
     def __init__(self):
+        # Published snapshots: replaced on every write, never mutated.
         self._plugins: Dict[str, PluginContract] = {}
-        self._versioned_plugins: Dict[Tuple[str, str], PluginContract] = {}
+        self._versions_by_pid: Dict[str, _VersionEntry] = {}
+        self._indexes = RegistryIndexes()
+        self._list_cache: Optional[
+            Tuple[Dict[str, PluginContract], Tuple[PluginContract, ...]]
+        ] = None
+        self._type_cache: Optional[
+            Tuple[Dict[str, PluginContract], Dict[str, List[PluginContract]]]
+        ] = None
         self._registry_lock = threading.Lock()
 
     @classmethod
     def instance(cls) -> "PluginRegistry":
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+        """Return the process-wide registry, created eagerly at import."""
+        return _REGISTRY_SINGLETON
 
     def register(
         self, plugin_class: Type[BasePlugin], override: bool = False
@@ -73,100 +88,195 @@ class PluginRegistry:
             raise TypeError(f"{plugin_class.__name__} must inherit from BasePlugin")
 
         contract = PluginContract(plugin_class)
-        pid = contract.pid
-
         with self._registry_lock:
-            if pid in self._plugins and not override:
-                existing_contract = self._plugins[pid]
+            plugins = dict(self._plugins)
+            versions_by_pid = dict(self._versions_by_pid)
+            indexes = self._indexes.copy()
+            result = self._register_contract(
+                contract, override, plugins, versions_by_pid, indexes
+            )
+            self._publish(plugins, versions_by_pid, indexes)
+            return result
+
+    def register_many(
+        self, plugin_classes: Iterable[Type[BasePlugin]], override: bool = False
+    ) -> List[PluginContract]:
+        """Register several plugin classes under a single lock acquisition.
+
+        Contracts are built for every class before the registry is touched,
+        so an invalid class leaves the registry unchanged.
+
+        Args:
+            plugin_classes: Plugin classes to register, in order
+            override: If True, replace existing registrations regardless of version
 
-                updated_contract = self._resolve_version_conflict(
-                    existing_contract, contract
+        Returns:
+            PluginContract in effect for each class, in input order
+
+        Raises:
+            TypeError: If any class is not a valid BasePlugin subclass
+        """
+        contracts = PluginContract.from_classes(plugin_classes)
+        with self._registry_lock:
+            plugins = dict(self._plugins)
+            versions_by_pid = dict(self._versions_by_pid)
+            indexes = self._indexes.copy()
+            results = [
+                self._register_contract(
+                    contract, override, plugins, versions_by_pid, indexes
                 )
-                self._plugins[pid] = updated_contract
-            else:
-                self._plugins[pid] = contract
+                for contract in contracts
+            ]
+            self._publish(plugins, versions_by_pid, indexes)
+            return results
+
+    def _register_contract(
+        self,
+        contract: PluginContract,
+        override: bool,
+        plugins: Dict[str, PluginContract],
+        versions_by_pid: Dict[str, _VersionEntry],
+        indexes: RegistryIndexes,
+    ) -> PluginContract:
+        """Insert a contract into working copies; caller must hold _registry_lock."""
+        pid = contract.pid
+        existing_contract = plugins.get(pid)
+        if existing_contract is not None and not override:
+            updated_contract = self._resolve_version_conflict(
+                existing_contract, contract
+            )
+        else:
+            updated_contract = contract
+
+        if updated_contract is not existing_contract:
+            if existing_contract is not None:
+                existing_contract.remove_from(indexes)
+            updated_contract.index_into(indexes)
+        plugins[pid] = updated_contract
+        versions_by_pid[pid] = self._add_version(versions_by_pid.get(pid), contract)
+        return updated_contract
+
+    @staticmethod
+    def _add_version(
+        entry: Optional[_VersionEntry], contract: PluginContract
+    ) -> _VersionEntry:
+        """Return a new version entry with contract added.
 
-            self._versioned_plugins[(pid, contract.version)] = contract
-            return self._plugins[pid]
+        Published entries are shared with readers, so dicts are copied
+        rather than updated.
+        """
+        if entry is None:
+            return contract
+        if isinstance(entry, PluginContract):
+            if entry.version == contract.version:
+                return contract
+            return {entry.version: entry, contract.version: contract}
+        versions = dict(entry)
+        versions[contract.version] = contract
+        return versions
+
+    def _publish(
+        self,
+        plugins: Dict[str, PluginContract],
+        versions_by_pid: Dict[str, _VersionEntry],
+        indexes: RegistryIndexes,
+    ) -> None:
+        """Swap in new snapshots; caller must hold _registry_lock."""
+        self._versions_by_pid = versions_by_pid
+        self._indexes = indexes
+        self._plugins = plugins
 
     @staticmethod
     def _resolve_version_conflict(
         existing: PluginContract, new: PluginContract
     ) -> PluginContract:
-        try:
-            existing_version = pkg_version.parse(existing.version)
-            new_version = pkg_version.parse(new.version)
-
-            if new_version >= existing_version:
-                return new
-            return existing
-
-        except pkg_version.InvalidVersion:
+        existing_version = existing._parsed_version
+        new_version = new._parsed_version
+        if existing_version is None or new_version is None:
+            return new
+        if new_version >= existing_version:
             return new
+        return existing
 
     def get_plugin(self, pid: str) -> Optional[PluginContract]:
-        with self._registry_lock:
-            return self._plugins.get(pid)
+        return self._plugins.get(pid)
 
     def get_plugin_by_version(self, pid: str, version: str) -> Optional[PluginContract]:
-        with self._registry_lock:
-            return self._versioned_plugins.get((pid, version))
+        entry = self._versions_by_pid.get(pid)
+        if isinstance(entry, PluginContract):
+            return entry if entry.version == version else None
+        return entry.get(version) if entry is not None else None
 
     def list_plugin_versions(self, pid: str) -> List[str]:
-        with self._registry_lock:
-            return [
-                registered_version
-                for (registered_pid, registered_version) in self._versioned_plugins
-                if registered_pid == pid
-            ]
+        entry = self._versions_by_pid.get(pid)
+        if isinstance(entry, PluginContract):
+            return [entry.version]
+        return list(entry) if entry is not None else []
 
-    def list_registered_plugins(self) -> List[PluginContract]:
-        with self._registry_lock:
-            return list(self._plugins.values())
+    def list_registered_plugins(self) -> Tuple[PluginContract, ...]:
+        """Return all registered plugins.
+
+        The result is an immutable snapshot that is built once and reused
+        until the next register, unregister or clear_all.
+        """
+        plugins = self._plugins
+        cached = self._list_cache
+        if cached is None or cached[0] is not plugins:
+            cached = (plugins, tuple(plugins.values()))
+            self._list_cache = cached
+        return cached[1]
 
     def list_plugins_by_capability(self, capability: str) -> List[PluginContract]:
-        with self._registry_lock:
-            return [
-                contract
-                for contract in self._plugins.values()
-                if capability in contract.capabilities
-            ]
+        """Return plugins declaring a capability, via the capability index."""
+        plugins = self._plugins
+        pids = self._indexes.capability_to_pids.get(capability, ())
+        return [plugins[pid] for pid in pids if pid in plugins]
 
     def list_plugins_by_type(self, agent_type: str) -> List[PluginContract]:
-        with self._registry_lock:
-            if agent_type == "specialized":
-                return [c for c in self._plugins.values() if c.is_specialized]
-            if agent_type == "scoped":
-                return [c for c in self._plugins.values() if c.is_scoped]
-            return []
+        """Return plugins whose agent is "specialized" or "scoped".
+
+        Agent types are only known once an agent has been created, so the
+        grouping is built on the first query after each registry change
+        rather than at registration time.
+        """
+        plugins = self._plugins
+        cached = self._type_cache
+        if cached is None or cached[0] is not plugins:
+            by_type = {
+                "specialized": [c for c in plugins.values() if c.is_specialized],
+                "scoped": [c for c in plugins.values() if c.is_scoped],
+            }
+            cached = (plugins, by_type)
+            self._type_cache = cached
+        return list(cached[1].get(agent_type, ()))
 
     def unregister(self, pid: str) -> bool:
         with self._registry_lock:
             if pid not in self._plugins:
                 return False
-            del self._plugins[pid]
-            versioned_keys = [key for key in self._versioned_plugins if key[0] == pid]
-            for key in versioned_keys:
-                del self._versioned_plugins[key]
+            plugins = dict(self._plugins)
+            indexes = self._indexes.copy()
+            plugins.pop(pid).remove_from(indexes)
+            versions_by_pid = dict(self._versions_by_pid)
+            versions_by_pid.pop(pid, None)
+            self._publish(plugins, versions_by_pid, indexes)
             return True
 
     def clear_all(self) -> None:
         with self._registry_lock:
-            self._plugins.clear()
-            self._versioned_plugins.clear()
+            self._publish({}, {}, RegistryIndexes())
 
     def get_all_ids(self) -> List[str]:
-        with self._registry_lock:
-            return list(self._plugins.keys())
+        return list(self._plugins)
 
     def has_plugin(self, pid: str) -> bool:
-        with self._registry_lock:
-            return pid in self._plugins
+        return pid in self._plugins
 
     def __repr__(self) -> str:
-        with self._registry_lock:
-            count = len(self._plugins)
-        return f"PluginRegistry(plugins={count})"
+        return f"PluginRegistry(plugins={len(self._plugins)})"
+
+
+_REGISTRY_SINGLETON = PluginRegistry()
 
 
 def register_plugin(
@@ -198,4 +308,28 @@ def register_plugin(
 
         register_plugin(MyPlugin)
     """
-    return PluginRegistry.instance().register(plugin_class)
+    return _REGISTRY_SINGLETON.register(plugin_class)
+
+
+def register_plugins(
+    plugin_classes: Iterable[Type[BasePlugin]],
+) -> List[PluginContract]:
+    """Register several plugins with the global registry in one batch.
+
+    Equivalent to calling register_plugin() for each class, but the
+    registry lock is taken once for the whole batch and nothing is
+    registered if any class is invalid.
+
+    Args:
+        plugin_classes: Plugin classes to register
+
+    Returns:
+        PluginContract in effect for each class, in input order
+
+    Example:
+        from cadence_sdk import register_plugins
+        from cadence_sdk.utils import discover_plugins_via_entry_points
+
+        register_plugins(discover_plugins_via_entry_points())
+    """
+    return _REGISTRY_SINGLETON.register_many(plugin_classes)
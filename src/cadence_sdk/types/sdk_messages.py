@@ -4,16 +4,28 @@ These message types provide a unified interface for agent communication
 across different orchestration frameworks (LangGraph, OpenAI Agents, Google ADK).
 """
 
+import json
 from abc import ABC
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, ClassVar, Dict, List, Literal, Optional, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
+def _new_id() -> str:
+    """Return a random 32-character hex identifier."""
+    return uuid4().hex
+
+
 class UvMessage(BaseModel, ABC):
     """Base class for all Cadence SDK messages.
 
+    Messages are pydantic models so that data from outside the process is
+    validated. Code that builds messages from data it already trusts can use
+    model_construct() to skip validation. Field defaults such as role and
+    message_id are still filled in, but validators do not run. For example,
+    UvAIMessage tool_calls must then already be ToolCall instances.
+
     Attributes:
         role: The role of the message sender (human, ai, system, tool)
         content: The message content (text or structured data)
@@ -28,7 +40,7 @@ class UvMessage(BaseModel, ABC):
                     "role": "human",
                     "content": "Hello, how can you help me?",
                     "metadata": {},
-                    "message_id": "123e4567-e89b-12d3-a456-426614174000",
+                    "message_id": "123e4567e89b12d3a456426614174000",
                 }
             ]
         }
@@ -37,7 +49,7 @@ class UvMessage(BaseModel, ABC):
     role: str
     content: Union[str, List[Dict[str, Any]]]
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    message_id: str = Field(default_factory=lambda: str(uuid4()))
+    message_id: str = Field(default_factory=_new_id)
 
     @field_validator("metadata", mode="before")
     @classmethod
@@ -49,8 +61,30 @@ class UvMessage(BaseModel, ABC):
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "UvMessage":
+        """Build a message from a dict.
+
+        Called on UvMessage itself, the concrete subclass is picked from the
+        "role" key, e.g. {"role": "ai", ...} yields a UvAIMessage.
+        """
+        if cls is UvMessage:
+            cls = _MESSAGE_TYPES_BY_ROLE.get(data.get("role"), UvMessage)
         return cls.model_validate(data)
 
+    def to_json(self) -> str:
+        """Serialize straight to JSON without building an intermediate dict."""
+        return self.model_dump_json()
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "UvMessage":
+        """Parse and validate a message from JSON produced by to_json().
+
+        Like from_dict(), calling this on UvMessage itself picks the concrete
+        subclass from the "role" key.
+        """
+        if cls is UvMessage:
+            return cls.from_dict(json.loads(data))
+        return cls.model_validate_json(data)
+
 
 class UvHumanMessage(UvMessage):
     """Message from a human user.
@@ -62,7 +96,9 @@ class UvHumanMessage(UvMessage):
         message_id: Unique identifier
     """
 
-    role: str = Field(default="human", frozen=True)
+    ROLE: ClassVar[str] = "human"
+
+    role: Literal["human"] = Field(default="human", frozen=True)
 
 
 class ToolCall(BaseModel):
@@ -86,7 +122,7 @@ class ToolCall(BaseModel):
         }
     )
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str
     args: Dict[str, Any]
 
@@ -102,17 +138,19 @@ class UvAIMessage(UvMessage):
         message_id: Unique identifier
     """
 
-    role: str = Field(default="ai", frozen=True)
+    ROLE: ClassVar[str] = "ai"
+
+    role: Literal["ai"] = Field(default="ai", frozen=True)
     tool_calls: List[ToolCall] = Field(default_factory=list)
 
     @field_validator("tool_calls", mode="before")
     @classmethod
     def _normalize_tool_calls(
         cls, value: Optional[List[Union[ToolCall, Dict[str, Any]]]]
-    ) -> List[ToolCall]:
-        if not value:
-            return []
-        return [ToolCall(**tc) if isinstance(tc, dict) else tc for tc in value]
+    ) -> List[Union[ToolCall, Dict[str, Any]]]:
+        # Only None needs handling here; pydantic-core converts dict entries
+        # to ToolCall itself when validating the List[ToolCall] field.
+        return value or []
 
 
 class UvSystemMessage(UvMessage):
@@ -125,7 +163,9 @@ class UvSystemMessage(UvMessage):
         message_id: Unique identifier
     """
 
-    role: str = Field(default="system", frozen=True)
+    ROLE: ClassVar[str] = "system"
+
+    role: Literal["system"] = Field(default="system", frozen=True)
 
 
 class UvContextMessage(UvMessage):
@@ -137,6 +177,8 @@ class UvContextMessage(UvMessage):
     the system prompt instead.
     """
 
+    ROLE: ClassVar[str] = "context"
+
     role: Literal["context"] = "context"
     content: Union[str, List[Dict[str, Any]]] = ""
     resource_id: str
@@ -155,20 +197,28 @@ class UvToolMessage(UvMessage):
         message_id: Unique identifier
     """
 
-    role: str = Field(default="tool", frozen=True)
+    ROLE: ClassVar[str] = "tool"
+
+    role: Literal["tool"] = Field(default="tool", frozen=True)
     tool_call_id: str
     tool_name: str
 
     def __init__(
         self,
-        content: Union[str, Dict[str, Any]],
+        content: Union[str, List[Dict[str, Any]]],
         tool_call_id: str,
         tool_name: str,
         metadata: Optional[Dict[str, Any]] = None,
         message_id: Optional[str] = None,
+        role: str = "tool",
     ):
+        """Keep the positional (content, tool_call_id, tool_name) signature.
+
+        Values are passed through to validation, so a role other than "tool"
+        is rejected rather than silently replaced.
+        """
         init_data: Dict[str, Any] = {
-            "role": "tool",
+            "role": role,
             "content": content,
             "tool_call_id": tool_call_id,
             "tool_name": tool_name,
@@ -179,6 +229,17 @@ class UvToolMessage(UvMessage):
         super().__init__(**init_data)
 
 
+_MESSAGE_TYPES_BY_ROLE: Dict[str, type[UvMessage]] = {
+    message_type.ROLE: message_type
+    for message_type in (
+        UvHumanMessage,
+        UvAIMessage,
+        UvSystemMessage,
+        UvToolMessage,
+        UvContextMessage,
+    )
+}
+
 AnyMessage = Union[
     UvHumanMessage,
     UvAIMessage,
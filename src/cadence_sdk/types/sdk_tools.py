@@ -5,6 +5,7 @@ tools that can be used across different orchestration frameworks.
 """
 
 import asyncio
+import functools
 import inspect
 from typing import Any, Callable, Dict, Optional, Union
 
@@ -37,6 +38,25 @@ class ToolRecord(TypedDict, total=False):
     stream_data: Any
 
 
+class _LazySignature:
+    """Non-data descriptor that computes a tool's __signature__ on first access.
+
+    The result is stored in the instance __dict__, which then shadows the
+    descriptor. Returns None (so inspect falls back) on the class itself and
+    on tools that were not created by @uvtool.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return None
+        func = instance.__dict__.get("_signature_func")
+        if func is None:
+            return None
+        signature = inspect.signature(func)
+        instance.__dict__["__signature__"] = signature
+        return signature
+
+
 class UvTool:
     """Framework-agnostic tool wrapper.
 
@@ -56,9 +76,14 @@ class UvTool:
         stream_filter: Optional sync or async callable ``(Any) -> Any`` applied
             to the raw tool result before streaming to the client. Does not
             affect the data that flows through the internal pipeline.
+        inline: When True, ainvoke() calls a sync tool directly on the event
+            loop instead of a worker thread. Only for cheap, non-blocking
+            functions.
         is_async: Whether the tool is async
     """
 
+    __signature__ = _LazySignature()
+
     def __init__(
         self,
         name: str,
@@ -69,16 +94,18 @@ class UvTool:
         required_validate: bool = False,
         stream_tool: bool = False,
         stream_filter: StreamFilter = None,
+        inline: bool = False,
     ):
         self.name = name
         self.description = description
         self.func = func
         self.args_schema = args_schema
-        self.metadata = metadata or {}
+        self.metadata = metadata if metadata is not None else {}
         self.required_validate = required_validate
         self.stream_tool = stream_tool
         self.stream_filter = stream_filter
-        self.is_async = asyncio.iscoroutinefunction(func)
+        self.inline = inline
+        self.is_async = inspect.iscoroutinefunction(func)
 
     def __call__(self, *args, **kwargs) -> Any:
         """Synchronous invocation.
@@ -95,15 +122,18 @@ class UvTool:
     async def ainvoke(self, *args, **kwargs) -> Any:
         """Async invocation.
 
-        For sync tools, runs in executor. For async tools, awaits directly.
+        For sync tools, runs in the default executor via asyncio.to_thread,
+        which also carries over the caller's contextvars, or directly when
+        the tool is inline. For async tools, awaits directly.
         """
         if self.is_async:
             return await self.func(*args, **kwargs)
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: self.func(*args, **kwargs))
+        if self.inline:
+            return self.func(*args, **kwargs)
+        return await asyncio.to_thread(self.func, *args, **kwargs)
 
     def invoke(self, *args, **kwargs) -> Any:
-        """Sync invocation alias."""
+        """Sync invocation alias; goes through __call__ so overrides apply."""
         return self(*args, **kwargs)
 
     def __repr__(self) -> str:
@@ -123,6 +153,7 @@ def uvtool(
     stream: bool = False,
     stream_filter: StreamFilter = None,
     validate: bool = False,
+    inline: bool = False,
     **metadata,
 ) -> Union[Callable, UvTool]:
     """Decorator to convert a function into a UvTool.
@@ -142,8 +173,14 @@ def uvtool(
             '''Tool that streams its result to the client.'''
             return await fetch_data(query)
 
+    It can also wrap a functools.partial, e.g. a module-level function bound
+    to an agent instance:
+        greet_tool = uvtool(functools.partial(greet, agent))
+
     Args:
-        func: Function to decorate (when used without parentheses)
+        func: Function to decorate (when used without parentheses). A
+            functools.partial is accepted; name and description come from
+            the wrapped function and the signature omits the bound arguments.
         name: Tool name (defaults to function name)
         description: Tool description (defaults to function docstring)
         args_schema: Optional Pydantic model for argument validation
@@ -156,6 +193,9 @@ def uvtool(
         validate: Whether the tool's output requires LLM validation. When True,
             the executor sets required_validate=True on the ToolRecord so the
             validator node knows to inspect this result against user intent.
+        inline: When True, ainvoke() runs a sync tool on the event loop instead
+            of a worker thread, skipping the thread hop. Only use it for cheap
+            functions that never block.
         **metadata: Additional metadata to store in tool.metadata
 
     Returns:
@@ -164,8 +204,9 @@ def uvtool(
     """
 
     def _create_tool_from_function(func: Callable) -> UvTool:
-        tool_name = name if name is not None else func.__name__
-        tool_description = _extract_description(func, tool_name, description)
+        target = _unwrap_partial(func)
+        tool_name = name if name is not None else target.__name__
+        tool_description = _extract_description(target, tool_name, description)
         tool = UvTool(
             name=tool_name,
             description=tool_description,
@@ -175,6 +216,7 @@ def uvtool(
             required_validate=validate,
             stream_tool=stream,
             stream_filter=stream_filter,
+            inline=inline,
         )
         _preserve_function_signature(tool, func)
         return tool
@@ -195,8 +237,17 @@ def _extract_description(
     return f"Tool: {tool_name}"
 
 
+def _unwrap_partial(func: Callable) -> Callable:
+    while isinstance(func, functools.partial):
+        func = func.func
+    return func
+
+
 def _preserve_function_signature(tool: UvTool, func: Callable) -> None:
-    tool.__signature__ = inspect.signature(func)
-    tool.__doc__ = func.__doc__
-    tool.__name__ = func.__name__
-    tool.__module__ = func.__module__
+    target = _unwrap_partial(func)
+    tool._signature_func = func
+    tool.__doc__ = target.__doc__
+    tool.__name__ = target.__name__
+    tool.__qualname__ = target.__qualname__
+    tool.__module__ = target.__module__
+    tool.__wrapped__ = func
@@ -1,16 +1,27 @@
 """Utility functions for Cadence SDK."""
 
+from .discovery import discover_plugins_via_entry_points
 from .installers import (
     check_dependency_installed,
     check_plugin_dependencies,
     install_dependencies,
 )
-from .validation import validate_plugin_structure, validate_plugin_structure_shallow
+from .validation import (
+    compile_settings_validator,
+    validate_plugin_settings,
+    validate_plugin_structure,
+    validate_plugin_structure_shallow,
+    validate_plugin_structures,
+)
 
 __all__ = [
     "validate_plugin_structure_shallow",
     "validate_plugin_structure",
+    "validate_plugin_structures",
+    "validate_plugin_settings",
+    "compile_settings_validator",
     "install_dependencies",
     "check_dependency_installed",
     "check_plugin_dependencies",
+    "discover_plugins_via_entry_points",
 ]
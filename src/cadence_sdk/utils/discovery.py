@@ -0,0 +1,63 @@
+"""Plugin discovery utilities.
+
+This module discovers plugin classes advertised by installed packages
+through entry points, without scanning directories or touching sys.path.
+"""
+
+import logging
+from importlib.metadata import entry_points
+from typing import List, Type
+
+from ..base import BasePlugin
+
+logger = logging.getLogger(__name__)
+
+PLUGIN_ENTRY_POINT_GROUP = "cadence.plugins"
+
+
+def discover_plugins_via_entry_points(
+    group: str = PLUGIN_ENTRY_POINT_GROUP,
+) -> List[Type[BasePlugin]]:
+    """Load plugin classes registered under an entry point group.
+
+    Entry points are read from installed package metadata, so discovery
+    costs one metadata index lookup instead of a filesystem walk. Entries
+    that fail to load or do not point to a BasePlugin subclass are logged
+    and skipped.
+
+    Args:
+        group: Entry point group to read (default "cadence.plugins")
+
+    Returns:
+        List of plugin classes, in entry point order
+
+    Example:
+        # pyproject.toml of the plugin package
+        [project.entry-points."cadence.plugins"]
+        my_plugin = "my_package.plugin:MyPlugin"
+
+        register_plugins(discover_plugins_via_entry_points())
+    """
+    plugins: List[Type[BasePlugin]] = []
+
+    for entry_point in entry_points(group=group):
+        try:
+            plugin_class = entry_point.load()
+        except Exception as e:
+            logger.warning(
+                "Failed to load plugin entry point %s: %s", entry_point.name, e
+            )
+            continue
+
+        if not (
+            isinstance(plugin_class, type) and issubclass(plugin_class, BasePlugin)
+        ):
+            logger.warning(
+                "Entry point %s does not reference a BasePlugin subclass",
+                entry_point.name,
+            )
+            continue
+
+        plugins.append(plugin_class)
+
+    return plugins
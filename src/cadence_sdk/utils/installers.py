@@ -4,17 +4,26 @@ This module provides utilities for installing plugin dependencies
 using pip.
 """
 
+import functools
 import importlib.metadata
+import importlib.util
 import logging
 import re
+import string
 import subprocess
 import sys
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_INSTALL_TIMEOUT_SECONDS = 300
-_PACKAGE_SPEC_SEPARATORS = re.compile(r"[><=!~\s\[;]")
+INSTALL_ERROR_TAIL_CHARS = 4096
+# Maps every character that can end a package name in a requirement string
+# (version operators, extras, markers, whitespace) to NUL.
+_PACKAGE_SPEC_SEPARATORS = str.maketrans(
+    dict.fromkeys("><=!~[;" + string.whitespace, "\0")
+)
+_DISTRIBUTION_NAME_SEPARATORS = re.compile(r"[-_.]+")
 
 
 def check_plugin_dependencies(
@@ -28,18 +37,64 @@ def check_plugin_dependencies(
 
     Returns:
         Tuple of (all_satisfied, missing_packages)
+
+    Note:
+        Installed distributions are read from package metadata and cached
+        until the next install_dependencies() run. Names not found there
+        (e.g. stdlib modules) fall back to check_dependency_installed().
     """
     if not dependencies:
         return True, []
 
-    missing = [
-        dep
-        for dep in dependencies
-        if not check_dependency_installed(extract_package_name(dep))
-    ]
+    installed = _installed_distributions()
+    missing = []
+    for dep in dependencies:
+        package_name = extract_package_name(dep)
+        if _normalize_distribution_name(package_name) in installed:
+            continue
+        if not check_dependency_installed(package_name):
+            missing.append(dep)
     return (True, []) if not missing else (False, missing)
 
 
+def _normalize_distribution_name(name: str) -> str:
+    """Normalize a distribution name per PEP 503."""
+    return _DISTRIBUTION_NAME_SEPARATORS.sub("-", name).lower()
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_distributions() -> Dict[str, str]:
+    """Return {normalized name: version} for all installed distributions.
+
+    Built from a single metadata scan and cached until the next
+    install_dependencies() run. Like importlib.metadata.version(), the
+    first distribution found on sys.path wins.
+    """
+    versions: Dict[str, str] = {}
+    for distribution in importlib.metadata.distributions():
+        name = distribution.metadata["Name"]
+        if name:
+            versions.setdefault(
+                _normalize_distribution_name(name), distribution.version
+            )
+    return versions
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_top_level_packages() -> frozenset:
+    """Return top-level import names provided by installed distributions.
+
+    Cached until the next install_dependencies() run.
+    """
+    return frozenset(importlib.metadata.packages_distributions())
+
+
+def _invalidate_installed_caches() -> None:
+    """Forget cached installed-package metadata after pip has run."""
+    _installed_distributions.cache_clear()
+    _installed_top_level_packages.cache_clear()
+
+
 def install_plugin_dependencies(
     dependencies: List[str], plugin_name: str
 ) -> Tuple[bool, List[str]]:
@@ -66,6 +121,53 @@ def install_plugin_dependencies(
     return (True, []) if not still_missing else (False, still_missing)
 
 
+def install_missing_across(
+    plugin_dependencies: List[Tuple[str, List[str]]],
+) -> Tuple[bool, Dict[str, List[str]]]:
+    """Install missing dependencies for several plugins with one pip call.
+
+    Missing requirements of all plugins are collected first and installed
+    in a single pip invocation, so pip starts and resolves only once.
+
+    Args:
+        plugin_dependencies: List of (plugin_name, dependencies) pairs
+
+    Returns:
+        Tuple of (all_satisfied, {plugin_name: still_missing_packages}),
+        where the mapping only contains plugins with missing packages
+
+    Example:
+        ok, missing = install_missing_across(
+            [("search", ["requests>=2.28"]), ("math", ["numpy"])]
+        )
+    """
+    missing_by_plugin: Dict[str, List[str]] = {}
+    for plugin_name, dependencies in plugin_dependencies:
+        satisfied, missing = check_plugin_dependencies(dependencies, plugin_name)
+        if not satisfied:
+            missing_by_plugin[plugin_name] = missing
+
+    if not missing_by_plugin:
+        return True, {}
+
+    to_install = sorted({dep for deps in missing_by_plugin.values() for dep in deps})
+    logger.info(
+        "Installing dependencies for %s: %s", sorted(missing_by_plugin), to_install
+    )
+    success, _ = install_dependencies(to_install)
+
+    if not success:
+        return False, missing_by_plugin
+
+    still_missing_by_plugin: Dict[str, List[str]] = {}
+    for plugin_name, missing in missing_by_plugin.items():
+        _, still_missing = check_plugin_dependencies(missing, plugin_name)
+        if still_missing:
+            still_missing_by_plugin[plugin_name] = still_missing
+    return not still_missing_by_plugin, still_missing_by_plugin
+
+
+@functools.lru_cache(maxsize=512)
 def extract_package_name(dependency_spec: str) -> str:
     """Extract package name from dependency specification.
 
@@ -75,12 +177,18 @@ def extract_package_name(dependency_spec: str) -> str:
     Returns:
         Package name without version specifiers
     """
-    return _PACKAGE_SPEC_SEPARATORS.split(dependency_spec.strip(), maxsplit=1)[0]
+    return (
+        dependency_spec.strip().translate(_PACKAGE_SPEC_SEPARATORS).partition("\0")[0]
+    )
 
 
 def check_dependency_installed(package_name: str) -> bool:
     """Check if a package is installed.
 
+    The package is looked up in the stdlib module list and installed
+    distribution metadata before falling back to locating (not executing)
+    the module on sys.path, so the check never imports the package.
+
     Args:
         package_name: Name of the package to check
 
@@ -93,10 +201,16 @@ def check_dependency_installed(package_name: str) -> bool:
         else:
             print("Please install requests")
     """
-    try:
-        __import__(package_name)
+    top_level = package_name.partition(".")[0]
+    if (
+        top_level in sys.stdlib_module_names
+        or top_level in _installed_top_level_packages()
+        or _normalize_distribution_name(package_name) in _installed_distributions()
+    ):
         return True
-    except ImportError:
+    try:
+        return importlib.util.find_spec(top_level) is not None
+    except (ImportError, ValueError):
         return False
 
 
@@ -108,7 +222,8 @@ def install_dependencies(
     Args:
         packages: List of package specifications (e.g., ["requests>=2.28", "numpy"])
         upgrade: If True, upgrade packages if already installed
-        quiet: If True, suppress pip output
+        quiet: If True, suppress pip output. Stdout is discarded rather
+            than buffered; only stderr is kept for error reporting.
 
     Returns:
         Tuple of (success, output/error_message)
@@ -134,15 +249,18 @@ def install_dependencies(
     try:
         result = subprocess.run(
             cmd,
-            capture_output=True,
+            stdout=subprocess.DEVNULL if quiet else subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=DEFAULT_INSTALL_TIMEOUT_SECONDS,
         )
+        _invalidate_installed_caches()
 
         if result.returncode == 0:
             return True, result.stdout or "Installation successful"
         else:
-            return False, result.stderr or "Installation failed"
+            stderr = result.stderr or ""
+            return False, stderr[-INSTALL_ERROR_TAIL_CHARS:] or "Installation failed"
 
     except subprocess.TimeoutExpired:
         return False, (
@@ -156,6 +274,9 @@ def install_dependencies(
 def get_installed_version(package_name: str) -> str:
     """Get installed version of a package.
 
+    Looked up in the cached distribution snapshot, which is refreshed after
+    the next install_dependencies() run.
+
     Args:
         package_name: Package name
 
@@ -166,7 +287,6 @@ def get_installed_version(package_name: str) -> str:
         version = get_installed_version("requests")
         print(f"requests version: {version}")
     """
-    try:
-        return importlib.metadata.version(package_name)
-    except Exception:
-        return ""
+    return _installed_distributions().get(
+        _normalize_distribution_name(package_name), ""
+    )
@@ -4,12 +4,58 @@ This module provides validation functions for checking plugin structure
 and requirements.
 """
 
-from typing import List, Optional, Tuple, Type
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from packaging import specifiers, version as pkg_version
 
 from .. import BaseScopedAgent
 from ..base import BaseAgent, BasePlugin, BaseSpecializedAgent, PluginMetadata
+from ..decorators.settings_decorators import (
+    _SETTINGS_VALIDATOR_ATTR,
+    _TYPE_MAP,
+    get_plugin_settings_schema,
+)
+from ..registry.contracts import (
+    _REQUIRED_PLUGIN_METHODS,
+    _parse_version,
+    _validated_agents,
+)
+from ..types import UvTool
+
+MAX_VALIDATION_WORKERS = 32
+
+_REQUIRED_METADATA_FIELDS = ("name", "version", "description")
+
+_ShallowResult = Tuple[bool, Tuple[str, ...], Optional[PluginMetadata]]
+_shallow_validation_cache: "weakref.WeakKeyDictionary[type, _ShallowResult]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _defined_attributes(cls: type, exclude: Tuple[type, ...] = ()) -> FrozenSet[str]:
+    """Return attribute names defined along cls's MRO, skipping exclude."""
+    return frozenset().union(
+        *(vars(klass) for klass in cls.__mro__ if klass not in exclude)
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_specifier_set(required: str) -> specifiers.SpecifierSet:
+    """Parse a version requirement; only valid requirements are cached."""
+    return specifiers.SpecifierSet(required)
 
 
 def validate_plugin_structure_shallow(plugin_class: Type) -> Tuple[bool, List[str]]:
@@ -30,25 +76,51 @@ def validate_plugin_structure_shallow(plugin_class: Type) -> Tuple[bool, List[st
         is_valid, errors = validate_plugin_structure_shallow(MyPlugin)
         if not is_valid:
             print("Validation errors:", errors)
+
+    Note:
+        Results are cached per plugin class, since these checks only depend
+        on the class itself.
     """
+    is_valid, errors, _ = _shallow_validate(plugin_class)
+    return is_valid, errors
+
+
+def _shallow_validate(
+    plugin_class: Type,
+) -> Tuple[bool, List[str], Optional[PluginMetadata]]:
+    """Run (or reuse) shallow validation, also returning the metadata read."""
+    if not isinstance(plugin_class, type):
+        return _run_shallow_validation(plugin_class)
+
+    cached = _shallow_validation_cache.get(plugin_class)
+    if cached is None:
+        is_valid, errors, metadata = _run_shallow_validation(plugin_class)
+        cached = (is_valid, tuple(errors), metadata)
+        _shallow_validation_cache[plugin_class] = cached
+    return cached[0], list(cached[1]), cached[2]
+
+
+def _run_shallow_validation(
+    plugin_class: Type,
+) -> Tuple[bool, List[str], Optional[PluginMetadata]]:
     errors = []
 
     base_class_error = _validate_base_plugin_subclass(plugin_class)
     if base_class_error:
         errors.append(base_class_error)
-        return False, errors
+        return False, errors, None
 
     method_errors = _validate_required_methods(plugin_class)
     errors.extend(method_errors)
 
     if errors:
-        return False, errors
+        return False, errors, None
 
-    metadata_errors = _validate_plugin_metadata(plugin_class)
+    metadata, metadata_errors = _validate_plugin_metadata(plugin_class)
     errors.extend(metadata_errors)
 
     is_valid = len(errors) == 0
-    return is_valid, errors
+    return is_valid, errors, metadata
 
 
 def _validate_base_plugin_subclass(plugin_class: Type) -> Optional[str]:
@@ -60,11 +132,10 @@ def _validate_base_plugin_subclass(plugin_class: Type) -> Optional[str]:
     Returns:
         Error message if invalid, None otherwise
     """
-    try:
-        if not issubclass(plugin_class, BasePlugin):
-            return f"{plugin_class.__name__} must inherit from BasePlugin"
-    except TypeError:
+    if not isinstance(plugin_class, type):
         return f"{plugin_class} is not a class"
+    if not issubclass(plugin_class, BasePlugin):
+        return f"{plugin_class.__name__} must inherit from BasePlugin"
     return None
 
 
@@ -77,25 +148,24 @@ def _validate_required_methods(plugin_class: Type) -> List[str]:
     Returns:
         List of error messages
     """
-    errors = []
-
-    if not hasattr(plugin_class, "get_metadata"):
-        errors.append("Plugin must implement get_metadata() method")
-
-    if not hasattr(plugin_class, "create_agent"):
-        errors.append("Plugin must implement create_agent() method")
-
-    return errors
+    implemented = _defined_attributes(plugin_class, exclude=(BasePlugin, object))
+    return [
+        f"Plugin must implement {method_name}() method"
+        for method_name in _REQUIRED_PLUGIN_METHODS
+        if method_name not in implemented
+    ]
 
 
-def _validate_plugin_metadata(plugin_class: Type) -> List[str]:
+def _validate_plugin_metadata(
+    plugin_class: Type,
+) -> Tuple[Optional[PluginMetadata], List[str]]:
     """Validate plugin metadata structure and content.
 
     Args:
         plugin_class: Plugin class to validate
 
     Returns:
-        List of error messages
+        Tuple of (metadata or None if it could not be read, error messages)
     """
     errors = []
 
@@ -106,14 +176,15 @@ def _validate_plugin_metadata(plugin_class: Type) -> List[str]:
             errors.append(
                 f"get_metadata() must return PluginMetadata, got {type(metadata)}"
             )
-            return errors
+            return None, errors
 
         errors.extend(_validate_metadata_fields(metadata))
 
     except Exception as e:
         errors.append(f"Error calling get_metadata(): {str(e)}")
+        return None, errors
 
-    return errors
+    return metadata, errors
 
 
 def _validate_metadata_fields(metadata: PluginMetadata) -> List[str]:
@@ -125,20 +196,13 @@ def _validate_metadata_fields(metadata: PluginMetadata) -> List[str]:
     Returns:
         List of error messages
     """
-    errors = []
-
-    if not metadata.name:
-        errors.append("Plugin metadata must have non-empty 'name'")
+    errors = [
+        f"Plugin metadata must have non-empty '{field}'"
+        for field in _REQUIRED_METADATA_FIELDS
+        if not getattr(metadata, field)
+    ]
 
-    if not metadata.version:
-        errors.append("Plugin metadata must have non-empty 'version'")
-
-    if not metadata.description:
-        errors.append("Plugin metadata must have non-empty 'description'")
-
-    try:
-        pkg_version.parse(metadata.version)
-    except pkg_version.InvalidVersion:
+    if _parse_version(metadata.version) is None:
         errors.append(f"Invalid version format: {metadata.version}")
 
     return errors
@@ -154,6 +218,11 @@ def validate_plugin_structure(plugin_class: Type[BasePlugin]) -> Tuple[bool, Lis
     - Check SDK version compatibility
     - Validate dependencies
 
+    For a valid stateless plugin the agent created here is kept until a
+    PluginContract takes it over as its shared agent, or until
+    clear_validated_agents() is called. An agent kept by an earlier
+    validation is not replaced.
+
     Args:
         plugin_class: Plugin class to validate
 
@@ -166,11 +235,10 @@ def validate_plugin_structure(plugin_class: Type[BasePlugin]) -> Tuple[bool, Lis
             for error in errors:
                 print(f"ERROR: {error}")
     """
-    is_valid, errors = validate_plugin_structure_shallow(plugin_class)
+    is_valid, errors, metadata = _shallow_validate(plugin_class)
     if not is_valid:
         return False, errors
 
-    metadata = plugin_class.get_metadata()
     agent = _validate_agent_creation(plugin_class, errors)
 
     if agent is None:
@@ -186,9 +254,42 @@ def validate_plugin_structure(plugin_class: Type[BasePlugin]) -> Tuple[bool, Lis
     _validate_plugin_dependencies(plugin_class, errors)
 
     is_valid = len(errors) == 0
+    if is_valid and metadata.stateless:
+        _validated_agents.setdefault(plugin_class, agent)
     return is_valid, errors
 
 
+def validate_plugin_structures(
+    plugin_classes: Iterable[Type[BasePlugin]],
+    max_workers: Optional[int] = None,
+) -> List[Tuple[bool, List[str]]]:
+    """Deeply validate several independent plugins concurrently.
+
+    Each plugin is validated with validate_plugin_structure() on a thread
+    pool, so slow create_agent() or validate_dependencies() calls overlap.
+
+    Args:
+        plugin_classes: Plugin classes to validate
+        max_workers: Thread pool size (default: one per plugin, capped at
+            MAX_VALIDATION_WORKERS)
+
+    Returns:
+        List of (is_valid, error_messages), in the order of plugin_classes
+
+    Example:
+        plugins = discover_plugins_via_entry_points()
+        results = validate_plugin_structures(plugins)
+        valid = [p for p, (ok, _) in zip(plugins, results) if ok]
+    """
+    plugin_classes = list(plugin_classes)
+    if len(plugin_classes) <= 1:
+        return [validate_plugin_structure(cls) for cls in plugin_classes]
+
+    workers = max_workers or min(MAX_VALIDATION_WORKERS, len(plugin_classes))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(validate_plugin_structure, plugin_classes))
+
+
 def _validate_agent_creation(
     plugin_class: Type[BasePlugin], errors: List[str]
 ) -> Optional[BaseAgent]:
@@ -224,11 +325,10 @@ def _validate_agent_interface(agent: BaseAgent, errors: List[str]) -> None:
         agent: Agent to validate
         errors: List to append errors to
     """
-    if not hasattr(agent, "get_tools"):
+    available = _defined_attributes(type(agent))
+    if "get_tools" not in available:
         errors.append("Agent must implement get_tools() method")
-    if isinstance(agent, BaseSpecializedAgent) and not hasattr(
-        agent, "get_system_prompt"
-    ):
+    if isinstance(agent, BaseSpecializedAgent) and "get_system_prompt" not in available:
         errors.append("Specialized agent must implement get_system_prompt() method")
 
 
@@ -246,13 +346,11 @@ def _validate_agent_tools(agent: BaseAgent, errors: List[str]) -> None:
             errors.append(f"Agent.get_tools() must return list, got {type(tools)}")
             return
 
-        from ..types import UvTool
-
-        for tool_index, tool in enumerate(tools):
-            if not isinstance(tool, UvTool):
-                errors.append(
-                    f"Tool at index {tool_index} is not a UvTool instance: {type(tool)}"
-                )
+        errors.extend(
+            f"Tool at index {tool_index} is not a UvTool instance: {type(tool)}"
+            for tool_index, tool in enumerate(tools)
+            if not isinstance(tool, UvTool)
+        )
 
     except Exception as e:
         errors.append(f"Error calling agent.get_tools(): {str(e)}")
@@ -288,9 +386,10 @@ def _validate_scoped_agent_required_func(
     Args:
         agent: Agent to validate
     """
-    if not hasattr(agent, "load_anchor"):
+    available = _defined_attributes(type(agent))
+    if "load_anchor" not in available:
         errors.append("Agent must implement load_anchor() method")
-    if not hasattr(agent, "build_scope_rules"):
+    if "build_scope_rules" not in available:
         errors.append("Agent must implement build_scope_rules() method")
 
 
@@ -345,8 +444,10 @@ def validate_sdk_version_compatibility(required: str, current: str) -> Tuple[boo
         )
     """
     try:
-        spec_set = specifiers.SpecifierSet(required)
-        current_ver = pkg_version.parse(current)
+        spec_set = _parse_specifier_set(required)
+        current_ver = _parse_version(current)
+        if current_ver is None:
+            raise pkg_version.InvalidVersion(f"Invalid version: {current!r}")
 
         if current_ver in spec_set:
             return True, ""
@@ -358,3 +459,75 @@ def validate_sdk_version_compatibility(required: str, current: str) -> Tuple[boo
 
     except Exception as e:
         return False, f"Error checking version compatibility: {str(e)}"
+
+
+def compile_settings_validator(
+    schema: List[Dict[str, Any]],
+) -> Callable[[Dict[str, Any]], List[str]]:
+    """Build a config validator specialized for a fixed settings schema.
+
+    The schema is walked once here; the returned function only runs the
+    precomputed required-key and type checks.
+
+    Args:
+        schema: Settings schema as returned by get_plugin_settings_schema()
+
+    Returns:
+        Function taking a config dict and returning a list of error messages
+
+    Example:
+        validate = compile_settings_validator(get_plugin_settings_schema(MyPlugin))
+        errors = validate({"api_key": "sk-...", "max_results": 5})
+    """
+    required_keys = tuple(
+        setting["key"]
+        for setting in schema
+        if setting.get("required") and setting.get("default") is None
+    )
+    typed_keys = tuple(
+        (setting["key"], setting["type"], _TYPE_MAP[setting["type"]])
+        for setting in schema
+    )
+
+    def validate(config: Dict[str, Any]) -> List[str]:
+        errors = [
+            f"Missing required setting '{key}'"
+            for key in required_keys
+            if config.get(key) is None
+        ]
+        for key, type_name, expected_type in typed_keys:
+            value = config.get(key)
+            if value is not None and not isinstance(value, expected_type):
+                errors.append(
+                    f"Setting '{key}' has type {type(value).__name__}, "
+                    f"but declared type is '{type_name}'"
+                )
+        return errors
+
+    return validate
+
+
+def validate_plugin_settings(
+    plugin_class: Type[BasePlugin], config: Dict[str, Any]
+) -> Tuple[bool, List[str]]:
+    """Validate a resolved config dict against a plugin's settings schema.
+
+    The validator is compiled on first use and cached on the plugin class
+    until clear_plugin_settings_cache() is called.
+
+    Args:
+        plugin_class: Plugin class declaring the settings schema
+        config: Flat {key: value} config passed to agent.initialize()
+
+    Returns:
+        Tuple of (is_valid, error_messages)
+
+    Example:
+        is_valid, errors = validate_plugin_settings(MyPlugin, {"api_key": "sk-..."})
+    """
+    validator = plugin_class.__dict__.get(_SETTINGS_VALIDATOR_ATTR)
+    if validator is None:
+        validator = compile_settings_validator(get_plugin_settings_schema(plugin_class))
+        setattr(plugin_class, _SETTINGS_VALIDATOR_ATTR, validator)
+    errors = validator(config)
+    return len(errors) == 0, errors
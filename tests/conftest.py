@@ -1,5 +1,6 @@
 """Pytest fixtures and shared test utilities for Cadence SDK tests."""
 
+from dataclasses import replace
 from typing import List
 
 import pytest
@@ -242,8 +243,7 @@ class PluginNoSdkVersion(BasePlugin):
             version="1.0.0",
             description="no sdk version",
         )
-        m.sdk_version = ""
-        return m
+        return replace(m, sdk_version="")
 
     @staticmethod
     def create_agent() -> BaseAgent:
@@ -257,13 +257,14 @@ def make_raw_metadata(**overrides) -> PluginMetadata:
         name="N",
         version="1.0.0",
         description="d",
-        capabilities=[],
-        dependencies=[],
+        capabilities=(),
+        dependencies=(),
         sdk_version=">=2.0.0",
         stateless=True,
     )
     m = PluginMetadata.__new__(PluginMetadata)
-    m.__dict__.update({**defaults, **overrides})
+    for key, value in {**defaults, **overrides}.items():
+        object.__setattr__(m, key, value)
     return m
 
 
@@ -1,6 +1,10 @@
 """Tests for BaseAgent."""
 
-from cadence_sdk import BaseAgent, UvTool
+import asyncio
+
+import pytest
+
+from cadence_sdk import BaseAgent, ToolCall, UvTool, uvtool
 
 
 class TestBaseAgentInterface:
@@ -66,3 +70,71 @@ class TestAgentFromPlugin:
         """Plugin create_agent returns BaseAgent instance."""
         agent = minimal_plugin.create_agent()
         assert isinstance(agent, BaseAgent)
+
+
+class TestAgentToolLookup:
+    """Tests for BaseAgent.get_tool."""
+
+    def test_get_tool_returns_tool_by_name(self, minimal_agent):
+        """get_tool returns the tool with the given name."""
+        tool = minimal_agent.get_tool("echo")
+        assert tool is minimal_agent.get_tools()[0]
+
+    def test_get_tool_reuses_index(self, minimal_agent):
+        """get_tool builds the name index once."""
+        minimal_agent.get_tool("echo")
+        index = minimal_agent._tool_index
+        minimal_agent.get_tool("echo")
+        assert minimal_agent._tool_index is index
+
+    def test_get_tool_raises_for_unknown_name(self, minimal_agent):
+        """get_tool raises KeyError for an unknown tool name."""
+        with pytest.raises(KeyError, match="no tool named 'missing'"):
+            minimal_agent.get_tool("missing")
+
+    def test_base_initialize_resets_index(self, minimal_agent):
+        """BaseAgent.initialize discards the tool index."""
+        minimal_agent.get_tool("echo")
+        BaseAgent.initialize(minimal_agent, {})
+        assert minimal_agent._tool_index is None
+
+
+class TestAgentBatchInvocation:
+    """Tests for BaseAgent.ainvoke_tools."""
+
+    async def test_returns_results_in_call_order(self, minimal_agent):
+        """ainvoke_tools returns one result per call, in order."""
+        calls = [ToolCall(name="echo", args={"text": str(i)}) for i in range(5)]
+        results = await minimal_agent.ainvoke_tools(calls)
+        assert results == ["0", "1", "2", "3", "4"]
+
+    async def test_respects_concurrency_limit(self):
+        """No more than `concurrency` tool calls run at the same time."""
+        in_flight = 0
+        peak = 0
+
+        class SlowAgent(BaseAgent):
+            def get_tools(self):
+                @uvtool
+                async def slow(x: int) -> int:
+                    """Sleep briefly."""
+                    nonlocal in_flight, peak
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                    await asyncio.sleep(0.01)
+                    in_flight -= 1
+                    return x
+
+                return [slow]
+
+        calls = [ToolCall(name="slow", args={"x": i}) for i in range(8)]
+        results = await SlowAgent().ainvoke_tools(calls, concurrency=2)
+        assert results == list(range(8))
+        assert peak == 2
+
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    async def test_rejects_non_positive_concurrency(self, minimal_agent, concurrency):
+        """A concurrency below 1 raises instead of hanging."""
+        calls = [ToolCall(name="echo", args={"text": "x"})]
+        with pytest.raises(ValueError, match="concurrency must be >= 1"):
+            await minimal_agent.ainvoke_tools(calls, concurrency=concurrency)
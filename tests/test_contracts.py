@@ -1,8 +1,43 @@
 """Tests for PluginContract."""
 
+from dataclasses import replace
+
 import pytest
 
-from cadence_sdk import PluginContract
+from cadence_sdk import PluginContract, validate_plugin_structure
+from cadence_sdk.registry import contracts
+from cadence_sdk.registry.contracts import (
+    _parse_version,
+    _validated_agents,
+    clear_validated_agents,
+)
+from .conftest import InvalidPluginNoCreateAgent, MinimalAgent, MinimalPlugin
+
+
+class StatefulPlugin(MinimalPlugin):
+    """MinimalPlugin variant declared as stateful."""
+
+    @staticmethod
+    def get_metadata():
+        return replace(MinimalPlugin.get_metadata(), stateless=False)
+
+    @staticmethod
+    def create_agent():
+        return MinimalAgent()
+
+
+@pytest.fixture
+def counting_plugin():
+    """Provide a stateless plugin class and the agents it has created."""
+    created = []
+
+    class CountingPlugin(MinimalPlugin):
+        @staticmethod
+        def create_agent():
+            created.append(MinimalAgent())
+            return created[-1]
+
+    return CountingPlugin, created
 
 
 class TestPluginContractCreation:
@@ -16,7 +51,7 @@ class TestPluginContractCreation:
         assert contract.name == "Minimal Plugin"
         assert contract.version == "1.0.0"
         assert contract.description == "Minimal plugin for tests"
-        assert contract.capabilities == ["echo"]
+        assert contract.capabilities == ("echo",)
         assert contract.is_specialized is True
         assert contract.is_stateless is True
 
@@ -29,6 +64,11 @@ class TestPluginContractCreation:
         with pytest.raises(TypeError, match="must inherit from BasePlugin"):
             PluginContract(NotAPlugin)
 
+    def test_rejects_plugin_missing_create_agent(self):
+        """PluginContract raises TypeError when create_agent is not implemented."""
+        with pytest.raises(TypeError, match="must implement create_agent"):
+            PluginContract(InvalidPluginNoCreateAgent)
+
     def test_metadata_is_cached(self, minimal_plugin):
         """PluginContract caches metadata on first access."""
         contract = PluginContract(minimal_plugin)
@@ -36,6 +76,13 @@ class TestPluginContractCreation:
         meta2 = contract.metadata
         assert meta1 is meta2
 
+    def test_rejects_unknown_attributes(self, minimal_plugin):
+        """PluginContract uses __slots__ and has no instance __dict__."""
+        contract = PluginContract(minimal_plugin)
+        assert not hasattr(contract, "__dict__")
+        with pytest.raises(AttributeError):
+            contract.extra = True
+
 
 class TestPluginContractMethods:
     """Tests for PluginContract methods."""
@@ -83,3 +130,118 @@ class TestPluginContractEquality:
         contract = PluginContract(minimal_plugin)
         assert contract != "not a contract"
         assert contract != None  # noqa: E711
+
+
+class TestPluginContractSharedAgent:
+    """Tests for PluginContract.get_shared_agent."""
+
+    def test_stateless_plugin_shares_agent(self, minimal_plugin):
+        """Stateless plugins return the same agent on every call."""
+        contract = PluginContract(minimal_plugin)
+        assert contract.get_shared_agent() is contract.get_shared_agent()
+
+    def test_create_agent_still_returns_fresh_instance(self, minimal_plugin):
+        """create_agent is unaffected by the shared agent."""
+        contract = PluginContract(minimal_plugin)
+        shared = contract.get_shared_agent()
+        assert contract.create_agent() is not shared
+
+    def test_stateful_plugin_gets_fresh_agent(self):
+        """Stateful plugins get a new agent per call."""
+        contract = PluginContract(StatefulPlugin)
+        assert contract.get_shared_agent() is not contract.get_shared_agent()
+
+    def test_stateless_plugin_adopts_validated_agent(self, counting_plugin):
+        """The agent built during deep validation becomes the shared agent."""
+        plugin_class, created = counting_plugin
+        assert validate_plugin_structure(plugin_class)[0] is True
+        contract = PluginContract(plugin_class)
+        assert contract.get_shared_agent() is created[0]
+        assert len(created) == 1
+        assert plugin_class not in _validated_agents
+
+    def test_stateful_plugin_does_not_keep_validated_agent(self):
+        """Validation keeps no agent for stateful plugins."""
+        assert validate_plugin_structure(StatefulPlugin)[0] is True
+        assert StatefulPlugin not in _validated_agents
+
+    def test_validation_does_not_mutate_plugin_class(self, counting_plugin):
+        """The validated agent is not stored on the plugin class."""
+        plugin_class, _ = counting_plugin
+        attributes = dict(vars(plugin_class))
+        assert validate_plugin_structure(plugin_class)[0] is True
+        assert dict(vars(plugin_class)) == attributes
+        assert plugin_class in _validated_agents
+
+    def test_revalidation_keeps_first_agent(self, counting_plugin):
+        """Validating again does not replace the kept agent."""
+        plugin_class, created = counting_plugin
+        validate_plugin_structure(plugin_class)
+        validate_plugin_structure(plugin_class)
+        assert len(created) == 2
+        assert PluginContract(plugin_class).get_shared_agent() is created[0]
+
+    def test_clear_validated_agents(self, counting_plugin):
+        """clear_validated_agents drops agents that were never adopted."""
+        plugin_class, _ = counting_plugin
+        validate_plugin_structure(plugin_class)
+        clear_validated_agents()
+        assert plugin_class not in _validated_agents
+
+
+class TestPluginContractResultCaching:
+    """Tests for cached dependency and health check results."""
+
+    @staticmethod
+    def _counting_plugin(calls):
+        class CountingPlugin(MinimalPlugin):
+            @staticmethod
+            def validate_dependencies():
+                calls.append("deps")
+                return []
+
+            @staticmethod
+            def health_check():
+                calls.append("health")
+                return {"status": "ok"}
+
+        return CountingPlugin
+
+    def test_validate_dependencies_runs_once(self):
+        """validate_dependencies is delegated once until invalidated."""
+        calls = []
+        contract = PluginContract(self._counting_plugin(calls))
+        contract.validate_dependencies()
+        contract.validate_dependencies()
+        assert calls == ["deps"]
+        contract.invalidate_caches()
+        contract.validate_dependencies()
+        assert calls == ["deps", "deps"]
+
+    def test_health_check_cached_within_ttl(self, monkeypatch):
+        """health_check reuses its result until the TTL expires."""
+        now = [100.0]
+        monkeypatch.setattr(contracts.time, "monotonic", lambda: now[0])
+        calls = []
+        contract = PluginContract(self._counting_plugin(calls))
+        assert contract.health_check() == {"status": "ok"}
+        contract.health_check()
+        assert calls == ["health"]
+        now[0] += contracts.HEALTH_CHECK_TTL_SECONDS
+        contract.health_check()
+        assert calls == ["health", "health"]
+
+
+class TestPluginContractVersionParsing:
+    """Tests for versions parsed once at construction."""
+
+    def test_parsed_version_reuses_cached_parse(self, minimal_plugin):
+        """Contracts with the same version share one parsed Version."""
+        first = PluginContract(minimal_plugin)
+        second = PluginContract(minimal_plugin)
+        assert str(first._parsed_version) == "1.0.0"
+        assert first._parsed_version is second._parsed_version
+
+    def test_invalid_version_parses_to_none(self):
+        """Non-PEP 440 versions parse to None instead of raising."""
+        assert _parse_version("1.0.0-not+valid+pep440") is None
@@ -0,0 +1,46 @@
+"""Tests for entry point plugin discovery."""
+
+from importlib.metadata import EntryPoint
+
+from cadence_sdk.utils import discovery
+from cadence_sdk.utils.discovery import (
+    PLUGIN_ENTRY_POINT_GROUP,
+    discover_plugins_via_entry_points,
+)
+from .conftest import MinimalPlugin
+
+
+def _patch_entry_points(monkeypatch, *values: str) -> None:
+    points = [
+        EntryPoint(name=f"ep{i}", value=value, group=PLUGIN_ENTRY_POINT_GROUP)
+        for i, value in enumerate(values)
+    ]
+
+    def fake_entry_points(group):
+        assert group == PLUGIN_ENTRY_POINT_GROUP
+        return points
+
+    monkeypatch.setattr(discovery, "entry_points", fake_entry_points)
+
+
+class TestDiscoverPluginsViaEntryPoints:
+    """Tests for discover_plugins_via_entry_points."""
+
+    def test_loads_plugin_classes(self, monkeypatch):
+        """Entry points referencing plugin classes are loaded."""
+        _patch_entry_points(monkeypatch, "tests.conftest:MinimalPlugin")
+        assert discover_plugins_via_entry_points() == [MinimalPlugin]
+
+    def test_skips_non_plugin_entries(self, monkeypatch):
+        """Entry points not referencing BasePlugin subclasses are skipped."""
+        _patch_entry_points(
+            monkeypatch,
+            "tests.conftest:InvalidPluginNoMetadata",
+            "tests.conftest:MinimalPlugin",
+        )
+        assert discover_plugins_via_entry_points() == [MinimalPlugin]
+
+    def test_skips_entries_that_fail_to_load(self, monkeypatch):
+        """Entry points that raise on load are skipped."""
+        _patch_entry_points(monkeypatch, "tests.no_such_module:Plugin")
+        assert discover_plugins_via_entry_points() == []
@@ -1,13 +1,16 @@
 """Tests for dependency installation utilities."""
 
+import subprocess
 from unittest.mock import MagicMock, patch
 
 from cadence_sdk.utils.installers import (
     DEFAULT_INSTALL_TIMEOUT_SECONDS,
+    INSTALL_ERROR_TAIL_CHARS,
     check_dependency_installed,
     extract_package_name,
     get_installed_version,
     install_dependencies,
+    install_missing_across,
     install_plugin_dependencies,
 )
 
@@ -31,6 +34,13 @@ class TestExtractPackageName:
         """extract_package_name returns name when no version specifier."""
         assert extract_package_name("numpy") == "numpy"
 
+    def test_extracts_name_before_extras_markers_and_spaces(self):
+        """extract_package_name stops at extras, markers and whitespace."""
+        assert extract_package_name("uvicorn[standard]>=0.30") == "uvicorn"
+        assert extract_package_name("tomli; python_version<'3.11'") == "tomli"
+        assert extract_package_name("  httpx ~= 0.27") == "httpx"
+        assert extract_package_name("pkg!=1.0") == "pkg"
+
 
 class TestCheckDependencyInstalled:
     """Tests for check_dependency_installed."""
@@ -43,6 +53,29 @@ class TestCheckDependencyInstalled:
         """check_dependency_installed returns False for nonexistent package."""
         assert check_dependency_installed("_nonexistent_package_xyz_123") is False
 
+    def test_accepts_distribution_name_spelling(self):
+        """check_dependency_installed resolves dashed distribution names."""
+        assert check_dependency_installed("typing-extensions") is True
+
+    def test_does_not_import_package(self):
+        """check_dependency_installed resolves packages without importing."""
+        with patch("builtins.__import__", side_effect=AssertionError):
+            assert check_dependency_installed("pluggy") is True
+
+    def test_install_invalidates_metadata_cache(self):
+        """install_dependencies clears the cached installed-package metadata."""
+        from cadence_sdk.utils.installers import _installed_top_level_packages
+
+        check_dependency_installed("pluggy")
+        assert _installed_top_level_packages.cache_info().currsize == 1
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        with patch(
+            "cadence_sdk.utils.installers.subprocess.run", return_value=mock_result
+        ):
+            install_dependencies(["pkg==1.0"])
+        assert _installed_top_level_packages.cache_info().currsize == 0
+
 
 class TestGetInstalledVersion:
     """Tests for get_installed_version."""
@@ -58,6 +91,27 @@ class TestGetInstalledVersion:
         version = get_installed_version("_nonexistent_package_xyz_456")
         assert version == ""
 
+    def test_accepts_distribution_name_spelling(self):
+        """get_installed_version normalizes dashes, underscores and case."""
+        assert get_installed_version("Typing-Extensions") == get_installed_version(
+            "typing_extensions"
+        )
+        assert get_installed_version("typing_extensions") != ""
+
+    def test_install_clears_cached_version(self):
+        """install_dependencies invalidates cached versions."""
+        from cadence_sdk.utils.installers import _installed_distributions
+
+        get_installed_version("pytest")
+        assert _installed_distributions.cache_info().currsize == 1
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        with patch(
+            "cadence_sdk.utils.installers.subprocess.run", return_value=mock_result
+        ):
+            install_dependencies(["pkg==1.0"])
+        assert _installed_distributions.cache_info().currsize == 0
+
 
 class TestInstallDependencies:
     """Tests for install_dependencies."""
@@ -254,3 +308,96 @@ class TestCheckPluginDependencies:
         satisfied, missing = check_plugin_dependencies(["json"], "test_plugin")
         assert satisfied is True
         assert missing == []
+
+    def test_installed_distribution_resolved_without_import(self):
+        from cadence_sdk.utils.installers import check_plugin_dependencies
+
+        with patch(
+            "cadence_sdk.utils.installers.check_dependency_installed",
+            side_effect=AssertionError("should not import"),
+        ):
+            satisfied, missing = check_plugin_dependencies(
+                ["Typing_Extensions>=4.0", "pydantic"], "test_plugin"
+            )
+        assert satisfied is True
+        assert missing == []
+
+
+class TestInstallDependenciesOutput:
+    """Tests for install_dependencies output handling."""
+
+    def test_quiet_discards_stdout(self):
+        """Quiet installs send pip stdout to DEVNULL instead of buffering it."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = None
+        with patch(
+            "cadence_sdk.utils.installers.subprocess.run", return_value=mock_result
+        ) as mock_run:
+            success, msg = install_dependencies(["pkg==1.0"])
+        assert mock_run.call_args.kwargs["stdout"] is subprocess.DEVNULL
+        assert success is True
+        assert msg == "Installation successful"
+
+    def test_failure_keeps_only_stderr_tail(self):
+        """Failed installs report only the tail of pip stderr."""
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stderr = "x" * (INSTALL_ERROR_TAIL_CHARS * 2) + "ERROR: last"
+        with patch(
+            "cadence_sdk.utils.installers.subprocess.run", return_value=mock_result
+        ):
+            success, msg = install_dependencies(["pkg==1.0"])
+        assert success is False
+        assert len(msg) == INSTALL_ERROR_TAIL_CHARS
+        assert msg.endswith("ERROR: last")
+
+
+class TestInstallMissingAcross:
+    """Tests for install_missing_across."""
+
+    def test_all_satisfied_skips_pip(self):
+        """install_missing_across does not run pip when nothing is missing."""
+        with patch("cadence_sdk.utils.installers.subprocess.run") as mock_run:
+            satisfied, missing = install_missing_across([("a", ["json"]), ("b", [])])
+        assert satisfied is True
+        assert missing == {}
+        mock_run.assert_not_called()
+
+    def test_single_pip_call_for_all_plugins(self):
+        """Missing packages of all plugins are installed in one pip call."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "ok"
+        with patch(
+            "cadence_sdk.utils.installers.subprocess.run", return_value=mock_result
+        ) as mock_run:
+            with patch(
+                "cadence_sdk.utils.installers.check_dependency_installed",
+                side_effect=[False, False, False, True, True, True],
+            ):
+                satisfied, missing = install_missing_across(
+                    [
+                        ("a", ["_pkg_b_xyz", "_pkg_a_xyz"]),
+                        ("b", ["_pkg_a_xyz"]),
+                    ]
+                )
+        assert mock_run.call_count == 1
+        args = mock_run.call_args[0][0]
+        assert args[-2:] == ["_pkg_a_xyz", "_pkg_b_xyz"]
+        assert satisfied is True
+        assert missing == {}
+
+    def test_reports_still_missing_per_plugin(self):
+        """install_missing_across maps each plugin to what is still missing."""
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stderr = "ERROR"
+        with patch(
+            "cadence_sdk.utils.installers.subprocess.run", return_value=mock_result
+        ):
+            satisfied, missing = install_missing_across(
+                [("a", ["json"]), ("b", ["_nonexistent_xyz_789"])]
+            )
+        assert satisfied is False
+        assert missing == {"b": ["_nonexistent_xyz_789"]}
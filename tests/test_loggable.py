@@ -43,3 +43,17 @@ class TestLoggable:
         plugin = LoggablePlugin()
         plugin.set_log_level(logging.DEBUG)
         assert plugin.logger.level == logging.DEBUG
+
+    def test_logger_is_shared_across_instances(self):
+        """Logger is cached on the class and shared by all instances."""
+        assert LoggablePlugin().logger is LoggablePlugin().logger
+        assert LoggablePlugin.__dict__["_class_logger"] is LoggablePlugin().logger
+
+    def test_subclass_gets_own_logger(self):
+        """Subclasses get a logger named after themselves."""
+
+        class ChildPlugin(LoggablePlugin):
+            pass
+
+        LoggablePlugin().logger
+        assert ChildPlugin().logger.name.endswith("ChildPlugin")
@@ -1,9 +1,12 @@
 """Tests for PluginMetadata."""
 
+import json
+import sys
+from dataclasses import FrozenInstanceError, asdict, fields, replace
+
 import pytest
 
 from cadence_sdk import PluginMetadata
-from cadence_sdk.base.metadata import MAX_VERSION_PARTS, MIN_VERSION_PARTS
 
 
 class TestPluginMetadataCreation:
@@ -21,8 +24,8 @@ class TestPluginMetadataCreation:
         assert metadata.name == "Test Plugin"
         assert metadata.version == "1.0.0"
         assert metadata.description == "A test plugin"
-        assert metadata.capabilities == []
-        assert metadata.dependencies == []
+        assert metadata.capabilities == ()
+        assert metadata.dependencies == ()
         assert metadata.sdk_version == ">=2.0.0,<3.0.0"
         assert metadata.stateless is True
 
@@ -38,69 +41,35 @@ class TestPluginMetadataCreation:
             sdk_version=">=3.0.0",
             stateless=False,
         )
-        assert metadata.capabilities == ["search", "fetch"]
-        assert metadata.dependencies == ["requests>=2.28"]
+        assert metadata.capabilities == ("search", "fetch")
+        assert metadata.dependencies == ("requests>=2.28",)
         assert metadata.stateless is False
 
-    def test_rejects_empty_pid(self):
-        """PluginMetadata raises ValueError when pid is empty."""
-        with pytest.raises(ValueError, match="Plugin pid cannot be empty"):
-            PluginMetadata(
-                pid="",
-                name="Test",
-                version="1.0.0",
-                description="Test",
-            )
-
-    def test_rejects_empty_name(self):
-        """PluginMetadata raises ValueError when name is empty."""
-        with pytest.raises(ValueError, match="Plugin name cannot be empty"):
-            PluginMetadata(
-                pid="com.test",
-                name="",
-                version="1.0.0",
-                description="Test",
-            )
-
-    def test_rejects_empty_version(self):
-        """PluginMetadata raises ValueError when version is empty."""
-        with pytest.raises(ValueError, match="Plugin version cannot be empty"):
-            PluginMetadata(
-                pid="com.test",
-                name="Test",
-                version="",
-                description="Test",
-            )
-
-    def test_rejects_empty_description(self):
-        """PluginMetadata raises ValueError when description is empty."""
-        with pytest.raises(ValueError, match="Plugin description cannot be empty"):
-            PluginMetadata(
-                pid="com.test",
-                name="Test",
-                version="1.0.0",
-                description="",
-            )
-
-    def test_rejects_invalid_version_format_single_part(self):
-        """PluginMetadata rejects version with only one part."""
-        with pytest.raises(ValueError, match="Invalid version format"):
-            PluginMetadata(
-                pid="com.test",
-                name="Test",
-                version="1",
-                description="Test",
-            )
-
-    def test_rejects_invalid_version_format_four_parts(self):
-        """PluginMetadata rejects version with four parts."""
-        with pytest.raises(ValueError, match="Invalid version format"):
-            PluginMetadata(
-                pid="com.test",
-                name="Test",
-                version="1.2.3.4",
-                description="Test",
-            )
+    @pytest.mark.parametrize(
+        ("field", "value", "message"),
+        [
+            ("pid", "", "Plugin pid cannot be empty"),
+            ("name", "", "Plugin name cannot be empty"),
+            ("version", "", "Plugin version cannot be empty"),
+            ("description", "", "Plugin description cannot be empty"),
+            ("version", "1", "Invalid version format"),
+            ("version", "1.2.3.4", "Invalid version format"),
+            ("version", "1.0.0\n", "Invalid version format"),
+            ("version", "1.0-", "Invalid version format"),
+            ("version", "1.0+", "Invalid version format"),
+        ],
+    )
+    def test_rejects_invalid_field(self, field, value, message):
+        """PluginMetadata raises ValueError for empty fields and bad versions."""
+        fields = {
+            "pid": "com.test",
+            "name": "Test",
+            "version": "1.0.0",
+            "description": "Test",
+        }
+        fields[field] = value
+        with pytest.raises(ValueError, match=message):
+            PluginMetadata(**fields)
 
     def test_accepts_two_part_version(self):
         """PluginMetadata accepts MAJOR.MINOR version format."""
@@ -122,6 +91,35 @@ class TestPluginMetadataCreation:
         )
         assert metadata.version == "1.2.3"
 
+    def test_accepts_prerelease_and_build_suffix(self):
+        """PluginMetadata accepts semver pre-release and build metadata."""
+        for version in ("1.2.3-rc.1", "1.2.3+build.5", "1.2-beta"):
+            metadata = PluginMetadata(
+                pid="com.test",
+                name="Test",
+                version=version,
+                description="Test",
+            )
+            assert metadata.version == version
+
+    def test_rejects_non_numeric_version(self):
+        """PluginMetadata rejects versions whose parts are not numbers."""
+        with pytest.raises(ValueError, match="Invalid version format"):
+            PluginMetadata(
+                pid="com.test",
+                name="Test",
+                version="a.b",
+                description="Test",
+            )
+
+    def test_rejects_invalid_version_on_every_construction(self):
+        """Invalid versions are not cached as valid after the first failure."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid version format"):
+                PluginMetadata(
+                    pid="com.test", name="Test", version="x", description="Test"
+                )
+
 
 class TestPluginMetadataSerialization:
     """Tests for to_dict and from_dict."""
@@ -163,10 +161,97 @@ class TestPluginMetadataSerialization:
         assert restored.capabilities == original.capabilities
 
 
-class TestVersionConstants:
-    """Tests for version validation constants."""
+class TestPluginMetadataImmutability:
+    """Tests for frozen, slotted PluginMetadata."""
+
+    def test_rejects_attribute_assignment(self):
+        """Assigning to a field raises FrozenInstanceError."""
+        metadata = PluginMetadata(
+            pid="com.test", name="Test", version="1.0.0", description="Test"
+        )
+        with pytest.raises(FrozenInstanceError):
+            metadata.name = "Other"
+
+    def test_pid_is_interned(self):
+        """pid is interned so equal pids share one string object."""
+        pid = "".join(["com.test.", "interned"])
+        metadata = PluginMetadata(
+            pid=pid, name="Test", version="1.0.0", description="Test"
+        )
+        assert metadata.pid is sys.intern("com.test.interned")
+
+    def test_has_no_instance_dict(self):
+        """Slotted instances carry no __dict__."""
+        metadata = PluginMetadata(
+            pid="com.test", name="Test", version="1.0.0", description="Test"
+        )
+        assert not hasattr(metadata, "__dict__")
+
+
+class TestPluginMetadataDictCache:
+    """Tests for cached to_dict output."""
+
+    def test_to_dict_returns_independent_copies(self):
+        """Mutating a to_dict result does not affect later calls."""
+        metadata = PluginMetadata(
+            pid="com.test", name="Test", version="1.0.0", description="Test"
+        )
+        first = metadata.to_dict()
+        first["name"] = "Changed"
+        assert metadata.to_dict()["name"] == "Test"
+
+    def test_to_dict_returns_lists_for_sequences(self):
+        """to_dict hands out fresh lists for capabilities and dependencies."""
+        metadata = PluginMetadata(
+            pid="com.test",
+            name="Test",
+            version="1.0.0",
+            description="Test",
+            capabilities=["a"],
+        )
+        metadata.to_dict()["capabilities"].append("b")
+        assert metadata.to_dict()["capabilities"] == ["a"]
+        assert metadata.capabilities == ("a",)
+
+    def test_cache_not_part_of_equality_or_repr(self):
+        """The cached dict does not affect equality or repr."""
+        a = PluginMetadata(pid="com.t", name="T", version="1.0", description="d")
+        b = PluginMetadata(pid="com.t", name="T", version="1.0", description="d")
+        a.to_dict()
+        assert a == b
+        assert "_dict_cache" not in repr(a)
+
+    def test_cache_not_a_dataclass_field(self):
+        """Cached output stays out of fields(), asdict() and replace()."""
+        metadata = PluginMetadata(pid="com.t", name="T", version="1.0", description="d")
+        metadata.to_dict()
+        assert "_dict_cache" not in {f.name for f in fields(metadata)}
+        assert "_dict_cache" not in asdict(metadata)
+        metadata.to_json()
+        assert "_json_cache" not in {f.name for f in fields(metadata)}
+        assert "_json_cache" not in asdict(metadata)
+        copy = replace(metadata, name="U")
+        assert copy.to_dict()["name"] == "U"
+        assert json.loads(copy.to_json())["name"] == "U"
+
+
+class TestPluginMetadataJson:
+    """Tests for cached to_json output."""
 
-    def test_version_constants_are_defined(self):
-        """MIN_VERSION_PARTS and MAX_VERSION_PARTS are defined."""
-        assert MIN_VERSION_PARTS == 2
-        assert MAX_VERSION_PARTS == 3
+    def test_to_json_matches_to_dict(self):
+        """to_json encodes the same fields as to_dict."""
+        metadata = PluginMetadata(
+            pid="com.test",
+            name="Test",
+            version="1.0.0",
+            description="Test",
+            capabilities=["a"],
+        )
+        assert json.loads(metadata.to_json()) == metadata.to_dict()
+
+    def test_to_json_is_cached(self):
+        """Repeated to_json calls return the same string object."""
+        metadata = PluginMetadata(
+            pid="com.test", name="Test", version="1.0.0", description="Test"
+        )
+        assert metadata.to_json() is metadata.to_json()
@@ -8,7 +8,7 @@ from .conftest import MinimalPlugin
 
 
 class TestBasePluginInterface:
-    """Tests for BasePlugin abstract interface."""
+    """Tests for BasePlugin interface."""
 
     def test_minimal_plugin_implements_required_methods(self, minimal_plugin):
         """MinimalPlugin implements get_metadata and create_agent."""
@@ -49,3 +49,35 @@ class TestBasePluginSubclass:
         """MinimalPlugin inherits from BasePlugin."""
         assert issubclass(MinimalPlugin, BasePluginClass)
         assert issubclass(MinimalPlugin, BasePlugin)
+
+
+class TestBasePluginMetadataCache:
+    """Tests for class-level metadata caching."""
+
+    def test_metadata_computed_once_per_class(self):
+        """_cached_metadata calls get_metadata only once."""
+        calls = []
+
+        class CountingPlugin(MinimalPlugin):
+            @staticmethod
+            def get_metadata() -> PluginMetadata:
+                calls.append(1)
+                return MinimalPlugin.get_metadata()
+
+        first = CountingPlugin._cached_metadata()
+        assert CountingPlugin._cached_metadata() is first
+        repr(CountingPlugin())
+        assert len(calls) == 1
+
+    def test_subclass_does_not_inherit_parent_cache(self):
+        """A subclass computes its own metadata."""
+        from dataclasses import replace
+
+        MinimalPlugin._cached_metadata()
+
+        class RenamedPlugin(MinimalPlugin):
+            @staticmethod
+            def get_metadata() -> PluginMetadata:
+                return replace(MinimalPlugin.get_metadata(), name="Renamed")
+
+        assert RenamedPlugin._cached_metadata().name == "Renamed"
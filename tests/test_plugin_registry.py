@@ -2,7 +2,12 @@
 
 import pytest
 
-from cadence_sdk import PluginContract, PluginRegistry, register_plugin
+from cadence_sdk import (
+    PluginContract,
+    PluginRegistry,
+    register_plugin,
+    register_plugins,
+)
 from .conftest import MinimalPluginV2
 
 
@@ -43,6 +48,40 @@ class TestPluginRegistration:
             plugin_registry.register(NotAPlugin)
 
 
+class TestPluginRegistryBulkRegistration:
+    """Tests for register_many."""
+
+    def test_register_many_returns_contracts_in_order(
+        self, plugin_registry, minimal_plugin
+    ):
+        """register_many returns the effective contract for each class."""
+        contracts = plugin_registry.register_many([minimal_plugin, MinimalPluginV2])
+        assert [c.version for c in contracts] == ["1.0.0", "2.0.0"]
+        assert plugin_registry.get_plugin("com.test.minimal").version == "2.0.0"
+        assert plugin_registry.list_plugin_versions("com.test.minimal") == [
+            "1.0.0",
+            "2.0.0",
+        ]
+
+    def test_register_plugins_convenience_function(
+        self, plugin_registry, minimal_plugin
+    ):
+        """register_plugins registers a batch with the global registry."""
+        contracts = register_plugins([minimal_plugin])
+        assert [c.pid for c in contracts] == ["com.test.minimal"]
+        assert plugin_registry.has_plugin("com.test.minimal")
+
+    def test_register_many_is_all_or_nothing(self, plugin_registry, minimal_plugin):
+        """An invalid class aborts the batch before anything is registered."""
+
+        class NotAPlugin:
+            pass
+
+        with pytest.raises(TypeError, match="must inherit from BasePlugin"):
+            plugin_registry.register_many([minimal_plugin, NotAPlugin])
+        assert plugin_registry.get_all_ids() == []
+
+
 class TestPluginRegistryLookup:
     """Tests for plugin lookup methods."""
 
@@ -77,6 +116,16 @@ class TestPluginRegistryLookup:
         assert len(plugins) == 1
         assert plugins[0].pid == "com.test.minimal"
 
+    def test_list_registered_plugins_reuses_snapshot(
+        self, plugin_registry, minimal_plugin
+    ):
+        """list_registered_plugins returns the same tuple until a mutation."""
+        plugin_registry.register(minimal_plugin)
+        first = plugin_registry.list_registered_plugins()
+        assert plugin_registry.list_registered_plugins() is first
+        plugin_registry.unregister("com.test.minimal")
+        assert plugin_registry.list_registered_plugins() == ()
+
     def test_get_all_ids_returns_pid_list(self, plugin_registry, minimal_plugin):
         """get_all_ids returns list of registered pids."""
         plugin_registry.register(minimal_plugin)
@@ -108,6 +157,60 @@ class TestPluginRegistryVersionConflict:
         assert contract.version == "1.0.0"
 
 
+class TestPluginRegistrySnapshots:
+    """Tests for lock-free reads of published snapshots."""
+
+    def test_reads_do_not_take_registry_lock(self, plugin_registry, minimal_plugin):
+        """Lookups succeed while a writer holds the registry lock."""
+        plugin_registry.register(minimal_plugin)
+        with plugin_registry._registry_lock:
+            assert plugin_registry.has_plugin("com.test.minimal")
+            assert plugin_registry.get_plugin("com.test.minimal") is not None
+            assert plugin_registry.get_all_ids() == ["com.test.minimal"]
+            assert len(plugin_registry.list_registered_plugins()) == 1
+            assert len(plugin_registry.list_plugins_by_capability("echo")) == 1
+            assert len(plugin_registry.list_plugins_by_type("specialized")) == 1
+
+    def test_register_does_not_mutate_published_snapshot(
+        self, plugin_registry, minimal_plugin
+    ):
+        """A snapshot read before a write is left unchanged by the write."""
+        snapshot = plugin_registry._plugins
+        plugin_registry.register(minimal_plugin)
+        assert snapshot == {}
+        assert plugin_registry._plugins is not snapshot
+
+
+class TestPluginRegistryVersions:
+    """Tests for per-pid version tracking."""
+
+    def test_single_version_lookup(self, plugin_registry, minimal_plugin):
+        """A pid with one version answers version queries."""
+        plugin_registry.register(minimal_plugin)
+        assert plugin_registry.list_plugin_versions("com.test.minimal") == ["1.0.0"]
+        contract = plugin_registry.get_plugin_by_version("com.test.minimal", "1.0.0")
+        assert contract.version == "1.0.0"
+        assert (
+            plugin_registry.get_plugin_by_version("com.test.minimal", "2.0.0") is None
+        )
+
+    def test_second_version_keeps_both(self, plugin_registry, minimal_plugin):
+        """Registering a second version keeps the first addressable."""
+        plugin_registry.register(minimal_plugin)
+        plugin_registry.register(MinimalPluginV2)
+        assert plugin_registry.get_plugin_by_version("com.test.minimal", "1.0.0")
+        assert plugin_registry.get_plugin_by_version("com.test.minimal", "2.0.0")
+
+    def test_unknown_pid_has_no_versions(self, plugin_registry):
+        """Unknown pids report no versions."""
+        assert plugin_registry.list_plugin_versions("com.unknown") == []
+        assert plugin_registry.get_plugin_by_version("com.unknown", "1.0.0") is None
+
+    def test_registry_has_no_instance_dict(self, plugin_registry):
+        """PluginRegistry uses __slots__."""
+        assert not hasattr(plugin_registry, "__dict__")
+
+
 class TestPluginRegistryFiltering:
     """Tests for capability and type filtering."""
 
@@ -126,12 +229,47 @@ class TestPluginRegistryFiltering:
         plugins = plugin_registry.list_plugins_by_capability("nonexistent")
         assert plugins == []
 
+    def test_list_plugins_by_capability_after_unregister(
+        self, plugin_registry, minimal_plugin
+    ):
+        """Unregistered plugins drop out of the capability index."""
+        plugin_registry.register(minimal_plugin)
+        plugin_registry.unregister("com.test.minimal")
+        assert plugin_registry.list_plugins_by_capability("echo") == []
+
+    def test_list_plugins_by_capability_after_upgrade(
+        self, plugin_registry, minimal_plugin
+    ):
+        """Capability queries return the winning version after an upgrade."""
+        plugin_registry.register(minimal_plugin)
+        plugin_registry.register(MinimalPluginV2)
+        plugins = plugin_registry.list_plugins_by_capability("echo")
+        assert [p.version for p in plugins] == ["2.0.0"]
+
     def test_list_plugins_by_type(self, plugin_registry, minimal_plugin):
         """list_plugins_by_type filters by agent_type."""
         plugin_registry.register(minimal_plugin)
         plugins = plugin_registry.list_plugins_by_type("specialized")
         assert len(plugins) == 1
 
+    def test_list_plugins_by_type_does_not_keep_shared_agent(
+        self, plugin_registry, minimal_plugin
+    ):
+        """Type probing uses a throwaway agent, not the shared one."""
+        plugin_registry.register(minimal_plugin)
+        (contract,) = plugin_registry.list_plugins_by_type("specialized")
+        assert contract._shared_agent is None
+
+    def test_list_plugins_by_type_tracks_registry_changes(
+        self, plugin_registry, minimal_plugin
+    ):
+        """The type grouping is rebuilt after the registry changes."""
+        assert plugin_registry.list_plugins_by_type("specialized") == []
+        plugin_registry.register(minimal_plugin)
+        assert len(plugin_registry.list_plugins_by_type("specialized")) == 1
+        assert plugin_registry.list_plugins_by_type("scoped") == []
+        assert plugin_registry.list_plugins_by_type("unknown") == []
+
 
 class TestPluginRegistryUnregister:
     """Tests for plugin unregistration."""
@@ -157,4 +295,4 @@ class TestPluginRegistryClear:
         plugin_registry.register(minimal_plugin)
         plugin_registry.clear_all()
         assert plugin_registry.get_plugin("com.test.minimal") is None
-        assert plugin_registry.list_registered_plugins() == []
+        assert plugin_registry.list_registered_plugins() == ()
@@ -1,5 +1,11 @@
 """Tests for cadence_sdk package initialization and public API."""
 
+import os
+import subprocess
+import sys
+
+import pytest
+
 
 class TestSdkImports:
     """Tests for SDK public API imports."""
@@ -66,3 +72,55 @@ class TestSdkImports:
         from cadence_sdk import plugin_settings
 
         assert plugin_settings is not None
+
+
+class TestSdkWarmup:
+    """Tests for SDK startup warmup."""
+
+    def test_registry_constructed_at_import(self):
+        """Importing cadence_sdk constructs the registry singleton."""
+        from cadence_sdk import PluginRegistry
+        from cadence_sdk.registry import plugin_registry
+
+        assert PluginRegistry.instance() is plugin_registry._REGISTRY_SINGLETON
+
+    def test_warmup_returns_global_registry(self):
+        """warmup() returns the global PluginRegistry instance."""
+        from cadence_sdk import PluginRegistry, warmup
+
+        assert warmup() is PluginRegistry.instance()
+
+
+class TestSdkLazyAttributes:
+    """Tests for lazily resolved package attributes."""
+
+    def test_dir_lists_public_api(self):
+        """dir(cadence_sdk) includes every name in __all__."""
+        import cadence_sdk
+
+        assert set(cadence_sdk.__all__) <= set(dir(cadence_sdk))
+
+    def test_lazy_attribute_resolves_from_submodule(self):
+        """Lazy attributes resolve to the submodule's object."""
+        import cadence_sdk
+        from cadence_sdk.decorators import plugin_settings
+
+        assert cadence_sdk.plugin_settings is plugin_settings
+
+    def test_import_does_not_load_packaging(self):
+        """Importing cadence_sdk leaves packaging unloaded until it is needed."""
+        code = "import sys, cadence_sdk; print('packaging' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert result.stdout.strip() == "False", result.stderr
+
+    def test_unknown_attribute_raises(self):
+        """Accessing an unknown attribute raises AttributeError."""
+        import cadence_sdk
+
+        with pytest.raises(AttributeError):
+            cadence_sdk.does_not_exist  # noqa: B018
@@ -1,9 +1,13 @@
 """Tests for SDK message types."""
 
+import pytest
+from pydantic import ValidationError
+
 from cadence_sdk import (
     ToolCall,
     UvAIMessage,
     UvHumanMessage,
+    UvMessage,
     UvSystemMessage,
     UvToolMessage,
 )
@@ -66,6 +70,14 @@ class TestUvAIMessage:
         assert msg.tool_calls[0].name == "fetch"
         assert isinstance(msg.tool_calls[0], ToolCall)
 
+    def test_accepts_mixed_and_none_tool_calls(self):
+        """UvAIMessage accepts mixed ToolCall/dict lists and None."""
+        tc = ToolCall(name="search", args={})
+        msg = UvAIMessage(content="", tool_calls=[tc, {"name": "fetch", "args": {}}])
+        assert msg.tool_calls[0] is tc
+        assert isinstance(msg.tool_calls[1], ToolCall)
+        assert UvAIMessage(content="", tool_calls=None).tool_calls == []
+
 
 class TestUvSystemMessage:
     """Tests for UvSystemMessage."""
@@ -101,6 +113,36 @@ class TestUvToolMessage:
         )
         assert msg.content == '{"result": "data"}'
 
+    def test_none_metadata_normalizes_to_empty_dict(self):
+        """metadata=None is normalized by the field validator."""
+        msg = UvToolMessage(content="r", tool_call_id="c", tool_name="t", metadata=None)
+        assert msg.metadata == {}
+
+    def test_accepts_positional_arguments(self):
+        """content, tool_call_id and tool_name can be passed positionally."""
+        msg = UvToolMessage("x", "1", "n")
+        assert msg.content == "x"
+        assert msg.tool_call_id == "1"
+        assert msg.tool_name == "n"
+        assert msg.role == "tool"
+
+    def test_rejects_other_role(self):
+        """The role is pinned to "tool"."""
+        with pytest.raises(ValidationError):
+            UvToolMessage(content="x", tool_call_id="1", tool_name="n", role="human")
+
+
+class TestPinnedRoles:
+    """Tests that each message class only accepts its own role."""
+
+    @pytest.mark.parametrize(
+        "message_type", [UvHumanMessage, UvAIMessage, UvSystemMessage]
+    )
+    def test_rejects_other_role(self, message_type):
+        """Passing a different role raises a validation error."""
+        with pytest.raises(ValidationError):
+            message_type(content="x", role="tool")
+
 
 class TestToolCall:
     """Tests for ToolCall model."""
@@ -118,6 +160,19 @@ class TestToolCall:
         assert tc.id == "custom-id"
 
 
+class TestMessageIds:
+    """Tests for generated message and tool call ids."""
+
+    def test_generated_ids_are_unique_hex(self):
+        """Default ids are distinct 32-character hex strings."""
+        first = UvHumanMessage(content="a")
+        second = UvHumanMessage(content="b")
+        assert first.message_id != second.message_id
+        assert len(first.message_id) == 32
+        int(first.message_id, 16)
+        assert len(ToolCall(name="t", args={}).id) == 32
+
+
 class TestUvMessageBase:
     """Tests for UvMessage base class."""
 
@@ -129,3 +184,65 @@ class TestUvMessageBase:
         assert "role" in data
         assert "content" in data
         assert "message_id" in data
+
+    def test_to_json_and_from_json_roundtrip(self):
+        """to_json and from_json preserve message data."""
+        msg = UvAIMessage(
+            content="Searching",
+            tool_calls=[ToolCall(name="search", args={"query": "x"})],
+            metadata={"model": "m"},
+        )
+        restored = UvAIMessage.from_json(msg.to_json())
+        assert restored == msg
+
+    def test_tool_message_from_json(self):
+        """from_json rebuilds tool messages despite their custom __init__."""
+        msg = UvToolMessage(content="Result", tool_call_id="c1", tool_name="search")
+        restored = UvToolMessage.from_json(msg.to_json())
+        assert restored.tool_call_id == "c1"
+        assert restored.tool_name == "search"
+        assert restored.message_id == msg.message_id
+
+    def test_base_from_json_roundtrips_ai_message(self):
+        """UvMessage.from_json rebuilds an AI message with its tool calls."""
+        original = UvAIMessage(
+            content="Searching",
+            tool_calls=[ToolCall(name="search", args={"query": "x"})],
+        )
+        restored = UvMessage.from_json(original.to_json())
+        assert type(restored) is UvAIMessage
+        assert restored == original
+
+    def test_base_from_json_roundtrips_tool_message(self):
+        """UvMessage.from_json rebuilds a tool message with its call fields."""
+        original = UvToolMessage(
+            content="Result", tool_call_id="c1", tool_name="search"
+        )
+        restored = UvMessage.from_json(original.to_json())
+        assert type(restored) is UvToolMessage
+        assert restored.tool_call_id == "c1"
+        assert restored.tool_name == "search"
+        assert restored == original
+
+    def test_base_from_dict_dispatches_on_role(self):
+        """UvMessage.from_dict builds the subclass matching the role."""
+        original = UvAIMessage(content="Hi", tool_calls=[{"name": "x", "args": {}}])
+        restored = UvMessage.from_dict(original.to_dict())
+        assert type(restored) is UvAIMessage
+        assert restored == original
+
+    def test_role_constants_match_defaults(self):
+        """Each message class's ROLE matches its role default."""
+        assert UvHumanMessage(content="x").role == UvHumanMessage.ROLE
+        assert UvSystemMessage(content="x").role == UvSystemMessage.ROLE
+        assert (
+            UvToolMessage(content="x", tool_call_id="c", tool_name="t").role
+            == UvToolMessage.ROLE
+        )
+
+    def test_model_construct_fills_defaults_without_validation(self):
+        """model_construct applies role and message_id defaults."""
+        msg = UvAIMessage.model_construct(content="trusted")
+        assert msg.role == "ai"
+        assert msg.message_id
+        assert msg.tool_calls == []
@@ -1,6 +1,9 @@
 """Tests for UvTool and uvtool decorator."""
 
-import asyncio
+import contextvars
+import functools
+import inspect
+import threading
 
 import pytest
 
@@ -67,7 +70,7 @@ class TestUvToolInvocation:
         assert add.invoke(2, 3) == 5
         assert add(2, 3) == 5
 
-    def test_async_tool_ainvoke_returns_result(self):
+    async def test_async_tool_ainvoke_returns_result(self):
         """Async tool ainvoke returns awaited result."""
 
         @uvtool
@@ -75,10 +78,10 @@ class TestUvToolInvocation:
             """Async echo."""
             return x
 
-        result = asyncio.run(async_echo.ainvoke("hello"))
+        result = await async_echo.ainvoke("hello")
         assert result == "hello"
 
-    def test_sync_tool_ainvoke_runs_in_executor(self):
+    async def test_sync_tool_ainvoke_runs_in_executor(self):
         """Sync tool ainvoke runs in executor for async compatibility."""
 
         @uvtool
@@ -86,9 +89,33 @@ class TestUvToolInvocation:
             """Multiply."""
             return a * b
 
-        result = asyncio.run(sync_multiply.ainvoke(4, 5))
+        result = await sync_multiply.ainvoke(4, 5)
         assert result == 20
 
+    async def test_inline_sync_tool_ainvoke_runs_on_loop_thread(self):
+        """Inline sync tools run on the event loop thread, not a worker."""
+
+        @uvtool(inline=True)
+        def current_thread() -> int:
+            """Return the current thread id."""
+            return threading.get_ident()
+
+        assert current_thread.inline is True
+        assert await current_thread.ainvoke() == threading.get_ident()
+        assert "inline" not in current_thread.metadata
+
+    async def test_sync_tool_ainvoke_sees_caller_context(self):
+        """Sync tools invoked via ainvoke see the caller's contextvars."""
+        request_id = contextvars.ContextVar("request_id", default=None)
+
+        @uvtool
+        def read_request_id() -> str:
+            """Read the request id."""
+            return request_id.get()
+
+        request_id.set("req-1")
+        assert await read_request_id.ainvoke() == "req-1"
+
     def test_async_tool_direct_call_raises_runtime_error(self):
         """Calling async tool directly raises RuntimeError."""
 
@@ -99,6 +126,20 @@ class TestUvToolInvocation:
         with pytest.raises(RuntimeError, match="Use ainvoke"):
             async_fn()
 
+    def test_invoke_uses_subclass_call(self):
+        """invoke goes through an overridden __call__."""
+
+        class LoudTool(UvTool):
+            def __call__(self, *args, **kwargs):
+                return super().__call__(*args, **kwargs).upper()
+
+        def echo(x: str) -> str:
+            """Echo input."""
+            return x
+
+        tool = LoudTool(name="echo", description="Echo input.", func=echo)
+        assert tool.invoke("hi") == "HI"
+
 
 class TestUvToolAttributes:
     """Tests for UvTool attributes."""
@@ -113,3 +154,78 @@ class TestUvToolAttributes:
 
         assert hasattr(sig_test, "__signature__")
         assert sig_test.__name__ == "sig_test"
+
+    def test_signature_computed_lazily(self):
+        """The signature is built on first inspection and then reused."""
+
+        @uvtool
+        def lazy(a: int) -> int:
+            """Lazy."""
+            return a
+
+        assert "__signature__" not in vars(lazy)
+        signature = inspect.signature(lazy)
+        assert list(signature.parameters) == ["a"]
+        assert inspect.signature(lazy) is signature
+
+    def test_metadata_dict_is_not_copied(self):
+        """UvTool keeps the metadata dict it was given, even when empty."""
+        metadata = {}
+        tool = UvTool(name="t", description="d", func=lambda: None, metadata=metadata)
+        assert tool.metadata is metadata
+
+    def test_decorator_metadata_not_shared_between_tools(self):
+        """Tools built by one decorator call get separate metadata dicts."""
+        decorator = uvtool(category="search")
+
+        first = decorator(lambda: None)
+        second = decorator(lambda: None)
+        first.metadata["extra"] = True
+        assert second.metadata == {"category": "search"}
+
+    def test_exposes_wrapped_function(self):
+        """UvTool exposes __wrapped__ and __qualname__ like functools.wraps."""
+
+        @uvtool
+        def wrapped_tool(a: int) -> int:
+            return a
+
+        assert inspect.unwrap(wrapped_tool) is wrapped_tool.func
+        assert wrapped_tool.__qualname__.endswith("wrapped_tool")
+        assert "__signature__" not in vars(wrapped_tool)
+
+    def test_signature_of_uvtool_class_is_unaffected(self):
+        """inspect.signature still works on the UvTool class itself."""
+        assert "func" in inspect.signature(UvTool).parameters
+
+
+def _bound_greet(prefix: str, name: str) -> str:
+    """Greet someone with a prefix."""
+    return f"{prefix}, {name}!"
+
+
+async def _bound_fetch(prefix: str, url: str) -> str:
+    """Fetch a URL."""
+    return f"{prefix}:{url}"
+
+
+class TestUvtoolPartial:
+    """Tests for @uvtool applied to functools.partial."""
+
+    def test_partial_uses_wrapped_function_metadata(self):
+        """Name and description come from the wrapped function."""
+        tool = uvtool(functools.partial(_bound_greet, "Hi"))
+        assert tool.name == "_bound_greet"
+        assert tool.description == "Greet someone with a prefix."
+        assert list(tool.__signature__.parameters) == ["name"]
+
+    def test_partial_invocation_passes_bound_args(self):
+        """Invoking the tool forwards bound and call arguments."""
+        tool = uvtool(functools.partial(_bound_greet, "Hi"))
+        assert tool.invoke(name="World") == "Hi, World!"
+
+    async def test_async_partial_is_detected(self):
+        """A partial over a coroutine function is treated as async."""
+        tool = uvtool(functools.partial(_bound_fetch, "get"))
+        assert tool.is_async is True
+        assert await tool.ainvoke(url="x") == "get:x"
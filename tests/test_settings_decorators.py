@@ -3,7 +3,12 @@
 import pytest
 
 from cadence_sdk import BasePlugin, PluginMetadata, plugin_settings
-from cadence_sdk.decorators.settings_decorators import get_plugin_settings_schema
+from cadence_sdk.decorators.settings_decorators import (
+    _validate_settings_schema,
+    clear_plugin_settings_cache,
+    get_plugin_setting,
+    get_plugin_settings_schema,
+)
 from .conftest import MinimalAgent
 
 
@@ -115,6 +120,29 @@ class TestPluginSettingsDecorator:
         assert "from_method" in keys
 
 
+class TestPluginSettingsNormalization:
+    """Tests for setting name normalization."""
+
+    def test_name_defaults_to_key_without_mutating_input(self):
+        """Missing names default to the key; input dicts are left untouched."""
+        settings = [{"key": "token", "type": "str", "description": "Token"}]
+
+        @plugin_settings(settings)
+        class NamedPlugin(BasePlugin):
+            @staticmethod
+            def get_metadata():
+                return PluginMetadata(
+                    pid="com.test.named", name="N", version="1.0.0", description="N"
+                )
+
+            @staticmethod
+            def create_agent():
+                return MinimalAgent()
+
+        assert get_plugin_settings_schema(NamedPlugin)[0]["name"] == "token"
+        assert "name" not in settings[0]
+
+
 class TestPluginSettingsValidation:
     """Tests for settings schema validation."""
 
@@ -180,3 +208,206 @@ class TestPluginSettingsValidation:
                 @staticmethod
                 def create_agent():
                     return MinimalAgent()
+
+
+class TestSettingsSchemaSinglePass:
+    """Tests for the remaining per-setting checks."""
+
+    def test_rejects_duplicate_key(self):
+        """Duplicate setting keys are rejected."""
+        setting = {"key": "a", "type": "str", "description": "A"}
+        with pytest.raises(ValueError, match="Duplicate setting key: a"):
+            _validate_settings_schema([setting, dict(setting)])
+
+    def test_duplicate_error_names_first_repeated_key(self):
+        """The duplicate check reports the first key that repeats."""
+        settings = [
+            {"key": k, "type": "str", "description": k} for k in ("a", "b", "b", "a")
+        ]
+        with pytest.raises(ValueError, match="Duplicate setting key: b"):
+            _validate_settings_schema(settings)
+
+    def test_rejects_non_bool_flag(self):
+        """required/sensitive must be booleans."""
+        with pytest.raises(ValueError, match="'sensitive' field .* must be bool"):
+            _validate_settings_schema(
+                [{"key": "a", "type": "str", "description": "A", "sensitive": 1}]
+            )
+
+    def test_rejects_default_of_wrong_type(self):
+        """Default values must match the declared type."""
+        with pytest.raises(ValueError, match="declared type is 'int'"):
+            _validate_settings_schema(
+                [{"key": "a", "type": "int", "description": "A", "default": "x"}]
+            )
+
+    def test_invalid_type_message_lists_valid_types(self):
+        """The invalid-type error lists valid types in sorted order."""
+        with pytest.raises(ValueError, match="bool, dict, float, int, list, str"):
+            _validate_settings_schema([{"key": "a", "type": "x", "description": "A"}])
+
+
+class TestPluginSettingsSchemaCache:
+    """Tests for class-level settings schema caching."""
+
+    def test_schema_method_called_once_per_class(self):
+        """get_plugin_settings_schema invokes get_settings_schema only once."""
+        calls = []
+
+        class CountingPlugin(BasePlugin):
+            @staticmethod
+            def get_metadata() -> PluginMetadata:
+                return PluginMetadata(
+                    pid="com.test.counting",
+                    name="Counting",
+                    version="1.0.0",
+                    description="Counts schema calls",
+                )
+
+            @staticmethod
+            def create_agent():
+                return MinimalAgent()
+
+            @staticmethod
+            def get_settings_schema():
+                calls.append(1)
+                return [{"key": "k", "type": "str", "description": "d"}]
+
+        first = get_plugin_settings_schema(CountingPlugin)
+        second = get_plugin_settings_schema(CountingPlugin)
+        assert first == second
+        assert len(calls) == 1
+
+    def test_cache_is_not_inherited_by_subclass(self):
+        """A subclass resolves its own schema instead of the parent's cache."""
+        get_plugin_settings_schema(SettingsPlugin)
+
+        @plugin_settings(
+            [{"key": "extra", "type": "str", "description": "Extra setting"}]
+        )
+        class ExtendedPlugin(SettingsPlugin):
+            pass
+
+        keys = [s["key"] for s in get_plugin_settings_schema(ExtendedPlugin)]
+        assert keys == ["extra", "api_key", "max_results"]
+
+    def test_clear_cache_picks_up_changed_schema(self):
+        """clear_plugin_settings_cache makes the next lookup re-resolve."""
+        schema = [{"key": "old", "type": "str", "description": "d"}]
+
+        class DynamicPlugin:
+            @staticmethod
+            def get_settings_schema():
+                return list(schema)
+
+        assert get_plugin_setting(DynamicPlugin, "old") is not None
+        schema[0] = {"key": "new", "type": "str", "description": "d"}
+        assert get_plugin_settings_schema(DynamicPlugin)[0]["key"] == "old"
+
+        clear_plugin_settings_cache(DynamicPlugin)
+        assert get_plugin_settings_schema(DynamicPlugin)[0]["key"] == "new"
+        assert get_plugin_setting(DynamicPlugin, "new") is not None
+        assert get_plugin_setting(DynamicPlugin, "old") is None
+
+    def test_clear_cache_keeps_decorated_schema(self):
+        """A decorated class's schema stays as combined at decoration."""
+        schema = [{"key": "old", "type": "str", "description": "d"}]
+
+        @plugin_settings([{"key": "extra", "type": "str", "description": "d"}])
+        class DecoratedPlugin:
+            @staticmethod
+            def get_settings_schema():
+                return list(schema)
+
+        schema[0] = {"key": "new", "type": "str", "description": "d"}
+        clear_plugin_settings_cache(DecoratedPlugin)
+        keys = [s["key"] for s in get_plugin_settings_schema(DecoratedPlugin)]
+        assert keys == ["extra", "old"]
+
+
+class TestGetPluginSetting:
+    """Tests for get_plugin_setting key lookups."""
+
+    def test_returns_setting_by_key(self):
+        """get_plugin_setting returns the matching setting definition."""
+        setting = get_plugin_setting(SettingsPlugin, "api_key")
+        assert setting["required"] is True
+        assert setting["sensitive"] is True
+
+    def test_returns_none_for_unknown_key(self):
+        """get_plugin_setting returns None for undeclared keys."""
+        assert get_plugin_setting(SettingsPlugin, "missing") is None
+
+    def test_subclass_uses_own_index(self):
+        """A decorated subclass sees its own settings, not a stale index."""
+        get_plugin_setting(SettingsPlugin, "api_key")
+
+        @plugin_settings(
+            [{"key": "extra", "type": "str", "description": "Extra setting"}]
+        )
+        class ExtendedPlugin(SettingsPlugin):
+            pass
+
+        assert get_plugin_setting(ExtendedPlugin, "extra")["key"] == "extra"
+        assert get_plugin_setting(ExtendedPlugin, "api_key") is not None
+        assert get_plugin_setting(SettingsPlugin, "extra") is None
+
+
+class TestCombinedSettingsSchemaMethod:
+    """Tests for combining decorator settings with an existing method."""
+
+    def test_existing_method_called_once_at_decoration(self):
+        """The existing method runs once when the decorator is applied."""
+        calls = []
+
+        class Base:
+            @staticmethod
+            def get_settings_schema():
+                calls.append(1)
+                return [{"key": "base", "type": "str", "description": "d"}]
+
+        Decorated = plugin_settings(
+            [{"key": "extra", "type": "str", "description": "d"}]
+        )(Base)
+
+        Decorated.get_settings_schema()
+        keys = [s["key"] for s in Decorated.get_settings_schema()]
+        assert keys == ["extra", "base"]
+        assert len(calls) == 1
+
+    def test_falls_back_to_per_call_combination_when_method_fails(self):
+        """A method that fails at decoration time is resolved lazily."""
+        state = {"ready": False}
+
+        class Base:
+            @staticmethod
+            def get_settings_schema():
+                if not state["ready"]:
+                    raise RuntimeError("not ready")
+                return [{"key": "late", "type": "str", "description": "d"}]
+
+        Decorated = plugin_settings(
+            [{"key": "extra", "type": "str", "description": "d"}]
+        )(Base)
+
+        with pytest.raises(RuntimeError, match="not ready"):
+            Decorated.get_settings_schema()
+        state["ready"] = True
+        keys = [s["key"] for s in Decorated.get_settings_schema()]
+        assert keys == ["extra", "late"]
+
+    def test_returns_new_list_per_call(self):
+        """Mutating a returned schema does not affect later calls."""
+
+        class Base:
+            @staticmethod
+            def get_settings_schema():
+                return [{"key": "base", "type": "str", "description": "d"}]
+
+        Decorated = plugin_settings(
+            [{"key": "extra", "type": "str", "description": "d"}]
+        )(Base)
+
+        Decorated.get_settings_schema().append({"key": "junk"})
+        keys = [s["key"] for s in Decorated.get_settings_schema()]
+        assert keys == ["extra", "base"]
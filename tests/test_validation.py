@@ -1,7 +1,13 @@
 """Tests for plugin validation utilities."""
 
+from dataclasses import replace
+
 import pytest
-from cadence_sdk import validate_plugin_structure, validate_plugin_structure_shallow
+from cadence_sdk import (
+    validate_plugin_structure,
+    validate_plugin_structure_shallow,
+    validate_plugin_structures,
+)
 from cadence_sdk.utils.validation import (
     _validate_agent_creation,
     _validate_agent_interface,
@@ -9,6 +15,8 @@ from cadence_sdk.utils.validation import (
     _validate_metadata_fields,
     _validate_plugin_dependencies,
     _validate_sdk_version,
+    compile_settings_validator,
+    validate_plugin_settings,
     validate_sdk_version_compatibility,
 )
 from .conftest import (
@@ -41,6 +49,12 @@ class TestValidatePluginStructureShallow:
         assert is_valid is False
         assert any("BasePlugin" in e for e in errors)
 
+    def test_rejects_plugin_without_create_agent(self):
+        """Shallow validation rejects plugins relying on the BasePlugin stub."""
+        is_valid, errors = validate_plugin_structure_shallow(InvalidPluginNoCreateAgent)
+        assert is_valid is False
+        assert errors == ["Plugin must implement create_agent() method"]
+
     def test_rejects_non_class(self):
         """Shallow validation rejects non-class (e.g. instance)."""
         is_valid, errors = validate_plugin_structure_shallow(MinimalPlugin())
@@ -63,6 +77,20 @@ class TestValidatePluginStructure:
         assert is_valid is True
         assert errors == []
 
+    def test_reads_metadata_once(self):
+        """Deep validation reuses the metadata read by the shallow pass."""
+        calls = []
+
+        class CountingPlugin(MinimalPlugin):
+            @staticmethod
+            def get_metadata():
+                calls.append(1)
+                return MinimalPlugin.get_metadata()
+
+        is_valid, errors = validate_plugin_structure(CountingPlugin)
+        assert is_valid is True, errors
+        assert len(calls) == 1
+
     def test_deep_validation_includes_shallow_checks(self):
         """Deep validation fails on same errors as shallow."""
         is_valid, errors = validate_plugin_structure(InvalidPluginNoMetadata)
@@ -70,6 +98,22 @@ class TestValidatePluginStructure:
         assert len(errors) > 0
 
 
+class TestValidatePluginStructures:
+    """Tests for validate_plugin_structures (concurrent deep validation)."""
+
+    def test_results_follow_input_order(self):
+        """Results line up with the plugin classes passed in."""
+        results = validate_plugin_structures(
+            [MinimalPlugin, InvalidPluginNoCreateAgent, MinimalPlugin]
+        )
+        assert [is_valid for is_valid, _ in results] == [True, False, True]
+        assert results[0] == validate_plugin_structure(MinimalPlugin)
+
+    def test_empty_input_returns_empty_list(self):
+        """No plugins means no results."""
+        assert validate_plugin_structures([]) == []
+
+
 class TestValidateSdkVersionCompatibility:
     """Tests for validate_sdk_version_compatibility."""
 
@@ -100,6 +144,20 @@ class TestValidateSdkVersionCompatibility:
         assert is_compat is False
         assert len(msg) > 0
 
+    def test_invalid_current_version_returns_false(self):
+        """validate_sdk_version_compatibility reports an invalid current version."""
+        is_compat, msg = validate_sdk_version_compatibility(">=3.0.0", "not.a.version")
+        assert is_compat is False
+        assert "not.a.version" in msg
+
+    def test_repeated_requirement_reuses_parsed_specifier(self):
+        """Identical requirement strings are parsed once."""
+        from cadence_sdk.utils.validation import _parse_specifier_set
+
+        assert _parse_specifier_set(">=3.0.0,<4.0.0") is _parse_specifier_set(
+            ">=3.0.0,<4.0.0"
+        )
+
 
 class TestValidateMetadataFields:
     def test_empty_name_reported(self):
@@ -203,8 +261,7 @@ class TestValidateSdkVersionInternal:
         assert errors == []
 
     def test_reports_error_when_sdk_version_empty(self):
-        metadata = MinimalPlugin.get_metadata()
-        metadata.sdk_version = ""
+        metadata = replace(MinimalPlugin.get_metadata(), sdk_version="")
         errors = []
         _validate_sdk_version(metadata, errors)
         assert len(errors) > 0
@@ -237,3 +294,69 @@ class TestValidatePluginStructureEdgeCases:
         is_valid, errors = validate_plugin_structure(PluginWithDepsError)
         assert is_valid is False
         assert any("Dependency" in e or "missing" in e for e in errors)
+
+
+class TestValidatePluginSettings:
+    """Tests for compiled settings validators."""
+
+    def test_accepts_valid_config(self):
+        """A config matching the schema produces no errors."""
+        from .test_settings_decorators import SettingsPlugin
+
+        is_valid, errors = validate_plugin_settings(
+            SettingsPlugin, {"api_key": "k", "max_results": 5}
+        )
+        assert is_valid is True
+        assert errors == []
+
+    def test_reports_missing_required_setting(self):
+        """A missing required setting without default is reported."""
+        from .test_settings_decorators import SettingsPlugin
+
+        is_valid, errors = validate_plugin_settings(SettingsPlugin, {})
+        assert is_valid is False
+        assert errors == ["Missing required setting 'api_key'"]
+
+    def test_reports_wrong_type(self):
+        """A value of the wrong type is reported."""
+        validate = compile_settings_validator(
+            [{"key": "limit", "type": "int", "description": "Limit"}]
+        )
+        assert validate({"limit": "ten"}) == [
+            "Setting 'limit' has type str, but declared type is 'int'"
+        ]
+
+    def test_validator_cached_on_class(self):
+        """The compiled validator is reused across calls."""
+        from .test_settings_decorators import SettingsPlugin
+
+        validate_plugin_settings(SettingsPlugin, {"api_key": "k"})
+        validator = SettingsPlugin.__dict__["_cadence_settings_validator"]
+        validate_plugin_settings(SettingsPlugin, {"api_key": "k"})
+        assert SettingsPlugin.__dict__["_cadence_settings_validator"] is validator
+
+
+class TestShallowValidationCache:
+    """Tests for per-class caching of shallow validation."""
+
+    def test_metadata_read_once_per_class(self):
+        """Repeated shallow validation does not call get_metadata again."""
+        calls = []
+
+        class CountingPlugin(MinimalPlugin):
+            @staticmethod
+            def get_metadata():
+                calls.append(1)
+                return MinimalPlugin.get_metadata()
+
+        first = validate_plugin_structure_shallow(CountingPlugin)
+        second = validate_plugin_structure_shallow(CountingPlugin)
+        assert first == second == (True, [])
+        assert len(calls) == 1
+
+    def test_returns_fresh_error_list(self):
+        """Callers mutating the returned errors do not affect the cache."""
+        _, errors = validate_plugin_structure_shallow(InvalidPluginNoMetadata)
+        errors.clear()
+        _, errors_again = validate_plugin_structure_shallow(InvalidPluginNoMetadata)
+        assert errors_again